@@ -37,6 +37,14 @@ class Settings(BaseSettings):
     )
     llm_max_tokens: int = Field(default=500, description="Maximum tokens per generation")
     llm_temperature: float = Field(default=0.8, description="LLM temperature (creativity)")
+    llm_timeout: Optional[float] = Field(
+        default=None,
+        description="Per-request timeout in seconds (derived from max tokens if unset)"
+    )
+    llm_max_concurrency: int = Field(
+        default=4,
+        description="Maximum concurrent provider requests during batch generation"
+    )
 
     # Alternative API Keys
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
@@ -10,8 +10,22 @@ import logging
 from .models import Base
 from config.settings import get_settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# JSON column codec: orjson when installed, otherwise the dialect's stdlib json
+if orjson is not None:
+    _JSON_ENGINE_OPTIONS = {
+        "json_serializer": lambda value: orjson.dumps(value).decode(),
+        "json_deserializer": orjson.loads,
+    }
+else:
+    _JSON_ENGINE_OPTIONS = {}
+
 # Global engine and session factory
 _engine = None
 _SessionFactory = None
@@ -35,7 +49,8 @@ def init_database(connection_string: str = None) -> None:
     _engine = create_engine(
         connection_string,
         echo=settings.debug_mode,
-        pool_pre_ping=True
+        pool_pre_ping=True,
+        **_JSON_ENGINE_OPTIONS
     )
 
     _SessionFactory = sessionmaker(bind=_engine)
@@ -3,7 +3,7 @@ Shards of Eternity - Database Models
 SQLAlchemy ORM models for the game database
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, ForeignKey, Text, Enum, Table
+from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, ForeignKey, Text, Enum, Table, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -280,7 +280,7 @@ class WorldState(Base):
 
     # Faction Power
     dominant_faction = Column(Enum(FactionType), nullable=True)
-    faction_shard_counts = Column(Text)  # JSON string of faction: count
+    faction_shard_counts = Column(JSON)  # Mapping of faction name -> shard count
 
     # World Stats
     total_souls_in_economy = Column(Integer, default=0)
@@ -309,12 +309,12 @@ class Location(Base):
     description = Column(Text)
     zone_type = Column(String(50))  # town, dungeon, wilderness, faction_hq, etc.
 
-    # Connections (stored as comma-separated location IDs or JSON)
-    connected_locations = Column(Text)  # JSON array of location IDs
+    # Connections
+    connected_locations = Column(JSON)  # List of connected location names
 
     # Inhabitants
-    npc_list = Column(Text)  # JSON array of NPC names/IDs
-    enemy_types = Column(Text)  # JSON array of enemy types
+    npc_list = Column(JSON)  # List of NPC names/IDs
+    enemy_types = Column(JSON)  # List of enemy types
 
     # Properties
     is_safe_zone = Column(Boolean, default=False)
@@ -0,0 +1,315 @@
+"""
+Initial world data used by main.py to seed a fresh database.
+Kept at module level so it is built once and can be edited without touching the seeders.
+"""
+from types import MappingProxyType
+
+from database.models import ClassType, FactionType, RaceType
+
+
+# ============================================================================
+# CRYSTAL SHARDS
+# ============================================================================
+
+SHARD_DATA = (
+    {
+        "shard_number": 1,
+        "shard_name": "Phoenix Flame",
+        "description": "A blazing crystal that burns with eternal fire",
+        "reality_influence": "Fire and Rebirth",
+        "guardian_boss_name": "Ignarok the Eternal",
+        "power_level": 100
+    },
+    {
+        "shard_number": 2,
+        "shard_name": "Ocean's Tear",
+        "description": "A sapphire crystal containing the primordial ocean",
+        "reality_influence": "Water and Adaptation",
+        "guardian_boss_name": "Thalassia the Depths",
+        "power_level": 100
+    },
+    {
+        "shard_number": 3,
+        "shard_name": "Mountain's Core",
+        "description": "Crystallized heart of the world's first mountain",
+        "reality_influence": "Earth and Endurance",
+        "guardian_boss_name": "Terrakor the Unmoved",
+        "power_level": 100
+    },
+    {
+        "shard_number": 4,
+        "shard_name": "Tempest Crown",
+        "description": "A crystal filled with eternal storms and lightning",
+        "reality_influence": "Air and Freedom",
+        "guardian_boss_name": "Zephyrath the Hurricane",
+        "power_level": 100
+    },
+    {
+        "shard_number": 5,
+        "shard_name": "Dawn's Radiance",
+        "description": "A brilliant crystal containing the first sunrise",
+        "reality_influence": "Light and Truth",
+        "guardian_boss_name": "Solarius the Radiant",
+        "power_level": 100
+    },
+    {
+        "shard_number": 6,
+        "shard_name": "Void Heart",
+        "description": "A black crystal that absorbs all light and hope",
+        "reality_influence": "Darkness and Fear",
+        "guardian_boss_name": "Nocturnyx the Void",
+        "power_level": 100
+    },
+    {
+        "shard_number": 7,
+        "shard_name": "Null Sphere",
+        "description": "A crystal that shouldn't exist, yet does",
+        "reality_influence": "Void and Unmaking",
+        "guardian_boss_name": "The Unmade",
+        "power_level": 100
+    },
+    {
+        "shard_number": 8,
+        "shard_name": "Hourglass Eternal",
+        "description": "A crystal containing all moments simultaneously",
+        "reality_influence": "Time and Fate",
+        "guardian_boss_name": "Chronovax the Timeless",
+        "power_level": 100
+    },
+    {
+        "shard_number": 9,
+        "shard_name": "Infinity Prism",
+        "description": "A crystal containing infinite space within finite form",
+        "reality_influence": "Space and Distance",
+        "guardian_boss_name": "Infinitus the Boundless",
+        "power_level": 100
+    },
+    {
+        "shard_number": 10,
+        "shard_name": "Genesis Seed",
+        "description": "The first spark of life crystallized",
+        "reality_influence": "Life and Growth",
+        "guardian_boss_name": "Vitaera the Ever-Growing",
+        "power_level": 100
+    },
+    {
+        "shard_number": 11,
+        "shard_name": "Reaper's Eye",
+        "description": "A crystal containing the final breath of all things",
+        "reality_influence": "Death and Entropy",
+        "guardian_boss_name": "Mortifax the Final",
+        "power_level": 100
+    },
+    {
+        "shard_number": 12,
+        "shard_name": "Entropy Engine",
+        "description": "Pure chaos crystallized into unstable form",
+        "reality_influence": "Chaos and Randomness",
+        "guardian_boss_name": "Chaoticus the Random",
+        "power_level": 100
+    }
+)
+
+
+# ============================================================================
+# LOCATIONS
+# ============================================================================
+
+LOCATION_DATA = (
+    {
+        "name": "The Nexus",
+        "description": "A neutral hub where all factions meet. The Crystal Shards pulse with energy here.",
+        "zone_type": "town",
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["Merchant", "Blacksmith", "Innkeeper", "Lorekeeper"],
+        "connected_locations": []
+    },
+    {
+        "name": "Ember Volcano",
+        "description": "An active volcano shrouded in perpetual flame. Home to the Phoenix Flame shard.",
+        "zone_type": "dungeon",
+        "is_safe_zone": False,
+        "danger_level": 8,
+        "enemy_types": ["Fire Elemental", "Lava Beast", "Flame Wraith"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Abyssal Trench",
+        "description": "The deepest point of the ocean, where pressure crushes all but the worthy.",
+        "zone_type": "dungeon",
+        "is_safe_zone": False,
+        "danger_level": 8,
+        "enemy_types": ["Sea Serpent", "Deep One", "Pressure Wraith"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Titan's Spine Mountains",
+        "description": "Impossibly tall mountains that pierce the clouds. Stone golems guard ancient secrets.",
+        "zone_type": "dungeon",
+        "is_safe_zone": False,
+        "danger_level": 9,
+        "enemy_types": ["Stone Golem", "Mountain Troll", "Avalanche Spirit"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Crimson Cathedral",
+        "description": "Headquarters of the Crimson Covenant. Blood magic permeates the air.",
+        "zone_type": "faction_hq",
+        "faction_controlled": FactionType.CRIMSON_COVENANT,
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["Blood Mage", "Covenant Leader", "Ritual Master"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Aether Academy",
+        "description": "The grand library and research center of the Aether Seekers.",
+        "zone_type": "faction_hq",
+        "faction_controlled": FactionType.AETHER_SEEKERS,
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["Archmage", "Librarian", "Research Scholar"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Iron Foundry",
+        "description": "The massive industrial complex of the Iron Brotherhood. Machines never sleep.",
+        "zone_type": "faction_hq",
+        "faction_controlled": FactionType.IRON_BROTHERHOOD,
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["Engineer", "Forgemaster", "Automaton Technician"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Twilight Grove",
+        "description": "An ethereal forest caught between day and night, home to the Moonlit Circle.",
+        "zone_type": "faction_hq",
+        "faction_controlled": FactionType.MOONLIT_CIRCLE,
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["Druid Elder", "Moon Priestess", "Shapeshifter"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Shadow Sanctum",
+        "description": "Hidden in darkness, the Shadowborn lurk in the spaces between reality.",
+        "zone_type": "faction_hq",
+        "faction_controlled": FactionType.SHADOWBORN,
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["Shadow Master", "Assassin Trainer", "Void Walker"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Golden Citadel",
+        "description": "A shining fortress of divine light, bastion of the Golden Order.",
+        "zone_type": "faction_hq",
+        "faction_controlled": FactionType.GOLDEN_ORDER,
+        "is_safe_zone": True,
+        "danger_level": 0,
+        "npc_list": ["High Paladin", "Divine Oracle", "Holy Knight"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Wilderness Outpost",
+        "description": "A small camp in the untamed wilds. Adventurers gather here.",
+        "zone_type": "wilderness",
+        "is_safe_zone": False,
+        "danger_level": 3,
+        "enemy_types": ["Wolf", "Bandit", "Wild Beast"],
+        "npc_list": ["Trader", "Scout"],
+        "connected_locations": ["The Nexus"]
+    },
+    {
+        "name": "Necropolis of Lost Souls",
+        "description": "An ancient city of the dead. The Reaper's Eye shard lies at its heart.",
+        "zone_type": "dungeon",
+        "is_safe_zone": False,
+        "danger_level": 9,
+        "enemy_types": ["Undead Knight", "Lich", "Soul Harvester"],
+        "connected_locations": ["The Nexus"]
+    }
+)
+
+
+# Shard number -> name of the location holding it
+SHARD_LOCATIONS = {
+    1: "Ember Volcano",
+    2: "Abyssal Trench",
+    3: "Titan's Spine Mountains",
+    11: "Necropolis of Lost Souls"
+}
+
+
+# ============================================================================
+# NPCS
+# ============================================================================
+
+# location_id is stamped at seed time (all sample NPCs start in The Nexus)
+NPC_DATA = (
+    {
+        "name": "Merchant Thane",
+        "is_player": False,
+        "race": RaceType.HUMAN,
+        "character_class": ClassType.ROGUE,
+        "faction": FactionType.GOLDEN_ORDER,
+        "level": 5,
+        "strength": 10,
+        "dexterity": 14,
+        "constitution": 12,
+        "intelligence": 16,
+        "wisdom": 13,
+        "charisma": 18
+    },
+    {
+        "name": "Blacksmith Gorin",
+        "is_player": False,
+        "race": RaceType.DWARF,
+        "character_class": ClassType.WARRIOR,
+        "faction": FactionType.IRON_BROTHERHOOD,
+        "level": 8,
+        "strength": 18,
+        "dexterity": 10,
+        "constitution": 16,
+        "intelligence": 12,
+        "wisdom": 14,
+        "charisma": 10
+    },
+    {
+        "name": "Lorekeeper Myra",
+        "is_player": False,
+        "race": RaceType.ELF,
+        "character_class": ClassType.SORCERER,
+        "faction": FactionType.AETHER_SEEKERS,
+        "level": 10,
+        "strength": 8,
+        "dexterity": 12,
+        "constitution": 10,
+        "intelligence": 18,
+        "wisdom": 16,
+        "charisma": 14
+    },
+    {
+        "name": "Shadow Whisper",
+        "is_player": False,
+        "race": RaceType.TIEFLING,
+        "character_class": ClassType.ROGUE,
+        "faction": FactionType.SHADOWBORN,
+        "level": 12,
+        "strength": 12,
+        "dexterity": 18,
+        "constitution": 14,
+        "intelligence": 14,
+        "wisdom": 10,
+        "charisma": 16
+    }
+)
+
+
+# Freeze the tables; seeders copy rows into fresh dicts before inserting
+SHARD_DATA = tuple(MappingProxyType(row) for row in SHARD_DATA)
+LOCATION_DATA = tuple(MappingProxyType(row) for row in LOCATION_DATA)
+SHARD_LOCATIONS = MappingProxyType(SHARD_LOCATIONS)
+NPC_DATA = tuple(MappingProxyType(row) for row in NPC_DATA)
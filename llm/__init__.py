@@ -4,6 +4,7 @@ Provides dynamic text generation for locations, NPCs, combat, and events.
 """
 from llm.generator import (
     LLMGenerator,
+    GenerationRequest,
     get_llm_generator,
     generate_location_description_sync,
     generate_npc_dialogue_sync,
@@ -12,6 +13,10 @@ from llm.generator import (
 )
 from llm.prompts import (
     PromptType,
+    PROMPT_LOCATION,
+    PROMPT_NPC,
+    PROMPT_COMBAT,
+    PROMPT_EVENT,
     get_fallback_text,
     format_location_prompt,
     format_npc_dialogue_prompt,
@@ -22,6 +27,7 @@ from llm.prompts import (
 __all__ = [
     # Generator
     "LLMGenerator",
+    "GenerationRequest",
     "get_llm_generator",
     # Sync wrappers
     "generate_location_description_sync",
@@ -30,6 +36,10 @@ __all__ = [
     "generate_event_narrative_sync",
     # Prompts
     "PromptType",
+    "PROMPT_LOCATION",
+    "PROMPT_NPC",
+    "PROMPT_COMBAT",
+    "PROMPT_EVENT",
     "get_fallback_text",
     "format_location_prompt",
     "format_npc_dialogue_prompt",
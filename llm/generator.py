@@ -3,8 +3,11 @@ LLM Generator module for dynamic text generation.
 Supports multiple providers (OpenAI, Anthropic, local models) with graceful fallbacks.
 """
 import asyncio
+import dataclasses
 import logging
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Union
 from enum import Enum
 
 from config.settings import get_settings
@@ -14,7 +17,10 @@ from llm.prompts import (
     format_combat_prompt,
     format_event_prompt,
     get_fallback_text,
-    PromptType
+    PROMPT_LOCATION,
+    PROMPT_NPC,
+    PROMPT_COMBAT,
+    PROMPT_EVENT,
 )
 
 
@@ -28,6 +34,60 @@ class LLMProvider(Enum):
     LOCAL = "local"
 
 
+@dataclass(slots=True, frozen=True)
+class GenerationRequest:
+    """
+    A single request for generate_multiple_descriptions.
+
+    ``type`` is one of "location", "npc", "combat" or "event"; only the
+    fields used by that type need to be set.
+    """
+    type: Optional[str] = None
+    # Location
+    location_name: Optional[str] = None
+    reality_type: Optional[str] = None
+    # NPC
+    npc_name: Optional[str] = None
+    player_action: Optional[str] = None
+    npc_background: Optional[str] = None
+    # Combat
+    attacker: Optional[str] = None
+    defender: Optional[str] = None
+    action: Optional[str] = None
+    result: Optional[str] = None
+    damage: Optional[int] = None
+    special_effects: Optional[str] = None
+    # Event
+    event_type: Optional[str] = None
+    # Location/event context dict, or the NPC situation string
+    context: Any = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GenerationRequest":
+        """
+        Build a request from the dictionary form (unknown keys are ignored).
+
+        Missing keys are left as None; see missing_fields() for validation.
+        """
+        return cls(**{name: data[name] for name in _REQUEST_FIELDS if name in data})
+
+    def missing_fields(self) -> Tuple[str, ...]:
+        """Names of the fields this request's type requires but are unset."""
+        required = _REQUIRED_FIELDS.get(self.type, ())
+        return tuple(name for name in required if getattr(self, name) is None)
+
+
+_REQUEST_FIELDS = tuple(f.name for f in dataclasses.fields(GenerationRequest))
+
+# Request type -> fields its generator method cannot do without
+_REQUIRED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "location": ("location_name", "reality_type"),
+    "npc": ("npc_name", "context", "player_action"),
+    "combat": ("attacker", "defender", "action", "result"),
+    "event": ("event_type", "context"),
+}
+
+
 class LLMGenerator:
     """
     Main LLM text generation class.
@@ -44,6 +104,9 @@ class LLMGenerator:
         self.base_url = self.settings.llm_base_url
         self.max_tokens = self.settings.llm_max_tokens
         self.temperature = self.settings.llm_temperature
+        # Roughly 50ms per generated token plus network slack
+        self.timeout = self.settings.llm_timeout or (self.max_tokens * 0.05 + 5)
+        self.max_concurrency = max(1, self.settings.llm_max_concurrency)
 
         # Provider clients (initialized lazily)
         self._openai_client = None
@@ -51,13 +114,32 @@ class LLMGenerator:
         self._local_client = None
 
         # Rate limiting and caching
-        self._request_count = 0
-        self._cache: Dict[str, str] = {}
+        self._cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
         self._cache_max_size = 100
 
+        # Usage statistics, updated in place as state changes (see get_stats)
+        self._stats: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "provider": self.provider.value,
+            "model": self.model,
+            "request_count": 0,
+            "cache_size": 0,
+            "cache_max_size": self._cache_max_size,
+            "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency
+        }
+
+        # Batch request type -> bound adapter, built once per instance
+        self._dispatch = {
+            "location": self._location_request,
+            "npc": self._npc_request,
+            "combat": self._combat_request,
+            "event": self._event_request,
+        }
+
         logger.info(
-            f"LLMGenerator initialized: enabled={self.enabled}, "
-            f"provider={self.provider.value}, model={self.model}"
+            "LLMGenerator initialized: enabled=%s, provider=%s, model=%s",
+            self.enabled, self.provider.value, self.model
         )
 
     # ===========================
@@ -146,7 +228,7 @@ class LLMGenerator:
                 max_tokens=self.max_tokens,
                 temperature=self.temperature
             )
-            self._request_count += 1
+            self._stats["request_count"] += 1
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"OpenAI generation failed: {e}")
@@ -178,7 +260,7 @@ class LLMGenerator:
                     {"role": "user", "content": user_prompt}
                 ]
             )
-            self._request_count += 1
+            self._stats["request_count"] += 1
             return message.content[0].text.strip()
         except Exception as e:
             logger.error(f"Anthropic generation failed: {e}")
@@ -210,7 +292,7 @@ class LLMGenerator:
                 max_tokens=self.max_tokens,
                 temperature=self.temperature
             )
-            self._request_count += 1
+            self._stats["request_count"] += 1
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"Local LLM generation failed: {e}")
@@ -220,7 +302,7 @@ class LLMGenerator:
         self,
         system_prompt: str,
         user_prompt: str,
-        cache_key: Optional[str] = None
+        cache_key: Optional[Tuple[Any, ...]] = None
     ) -> Optional[str]:
         """
         Generate text using the configured provider.
@@ -238,9 +320,11 @@ class LLMGenerator:
             return None
 
         # Check cache
-        if cache_key and cache_key in self._cache:
-            logger.debug(f"Cache hit for key: {cache_key}")
-            return self._cache[cache_key]
+        if cache_key:
+            cached = self._get_from_cache(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit for key: %s", cache_key)
+                return cached
 
         # Generate based on provider
         result = None
@@ -261,17 +345,24 @@ class LLMGenerator:
 
         return result
 
-    def _add_to_cache(self, key: str, value: str):
-        """Add item to cache with size management."""
-        if len(self._cache) >= self._cache_max_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+    def _get_from_cache(self, key: Tuple[Any, ...]) -> Optional[str]:
+        """Look up a cached result, marking it most recently used."""
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
+
+    def _add_to_cache(self, key: Tuple[Any, ...], value: str):
+        """Add item to cache, evicting the least recently used entry when full."""
         self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+        self._stats["cache_size"] = len(self._cache)
 
-    def _make_cache_key(self, *args) -> str:
-        """Create a cache key from arguments."""
-        return "|".join(str(arg) for arg in args)
+    def _make_cache_key(self, *args) -> Tuple[Any, ...]:
+        """Create a cache key from arguments (hashed as a tuple, never stringified)."""
+        return args
 
     # ===========================
     # Public API Methods
@@ -296,6 +387,9 @@ class LLMGenerator:
         Returns:
             Generated or fallback description
         """
+        if not self.enabled:
+            return get_fallback_text(PROMPT_LOCATION, reality_type)
+
         prompts = format_location_prompt(location_name, reality_type, context)
         cache_key = self._make_cache_key(
             "location", location_name, reality_type
@@ -310,8 +404,8 @@ class LLMGenerator:
         if result:
             return result
         else:
-            logger.debug(f"Using fallback for location: {location_name}")
-            return get_fallback_text(PromptType.LOCATION_DESCRIPTION, reality_type)
+            logger.debug("Using fallback for location: %s", location_name)
+            return get_fallback_text(PROMPT_LOCATION, reality_type)
 
     async def generate_npc_dialogue(
         self,
@@ -334,6 +428,9 @@ class LLMGenerator:
         Returns:
             Generated or fallback dialogue
         """
+        if not self.enabled:
+            return get_fallback_text(PROMPT_NPC)
+
         prompts = format_npc_dialogue_prompt(
             npc_name, context, player_action, npc_background
         )
@@ -350,8 +447,8 @@ class LLMGenerator:
         if result:
             return result
         else:
-            logger.debug(f"Using fallback for NPC dialogue: {npc_name}")
-            return get_fallback_text(PromptType.NPC_DIALOGUE)
+            logger.debug("Using fallback for NPC dialogue: %s", npc_name)
+            return get_fallback_text(PROMPT_NPC)
 
     async def generate_combat_description(
         self,
@@ -378,6 +475,9 @@ class LLMGenerator:
         Returns:
             Generated or fallback combat description
         """
+        if not self.enabled:
+            return get_fallback_text(PROMPT_COMBAT, result)
+
         prompts = format_combat_prompt(
             attacker, defender, action, result, damage, special_effects
         )
@@ -396,8 +496,8 @@ class LLMGenerator:
         if result_text:
             return result_text
         else:
-            logger.debug(f"Using fallback for combat: {action} -> {result}")
-            return get_fallback_text(PromptType.COMBAT_DESCRIPTION, result)
+            logger.debug("Using fallback for combat: %s -> %s", action, result)
+            return get_fallback_text(PROMPT_COMBAT, result)
 
     async def generate_event_narrative(
         self,
@@ -416,6 +516,9 @@ class LLMGenerator:
         Returns:
             Generated or fallback event narrative
         """
+        if not self.enabled:
+            return get_fallback_text(PROMPT_EVENT, event_type)
+
         prompts = format_event_prompt(event_type, context)
         cache_key = self._make_cache_key(
             "event", event_type
@@ -430,8 +533,8 @@ class LLMGenerator:
         if result:
             return result
         else:
-            logger.debug(f"Using fallback for event: {event_type}")
-            return get_fallback_text(PromptType.EVENT_NARRATIVE, event_type)
+            logger.debug("Using fallback for event: %s", event_type)
+            return get_fallback_text(PROMPT_EVENT, event_type)
 
     # ===========================
     # Batch Generation
@@ -439,94 +542,140 @@ class LLMGenerator:
 
     async def generate_multiple_descriptions(
         self,
-        requests: List[Dict[str, Any]]
+        requests: List[Union[GenerationRequest, Dict[str, Any]]]
     ) -> List[str]:
         """
         Generate multiple descriptions in parallel.
 
         Args:
-            requests: List of request dictionaries with 'type' and required params
+            requests: List of GenerationRequest records (or equivalent dictionaries
+                with 'type' and the required params)
 
         Returns:
             List of generated descriptions (in same order as requests)
         """
+        requests = [
+            req if isinstance(req, GenerationRequest) else GenerationRequest.from_dict(req)
+            for req in requests
+        ]
+
+        # Throttle provider calls; the timeout only starts once a slot is held
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        timeout = self.timeout
+
+        async def run(handler, req):
+            missing = req.missing_fields()
+            if missing:
+                # Fall back instead of prompting the provider with "None"
+                raise ValueError(f"{req.type} request missing {', '.join(missing)}")
+            async with semaphore:
+                # Bound each request so one slow provider call can't hold up the batch
+                return await asyncio.wait_for(handler(req), timeout=timeout)
+
+        dispatch = self._dispatch
         tasks = []
         for req in requests:
-            req_type = req.get("type")
-            if req_type == "location":
-                task = self.generate_location_description(
-                    req["location_name"],
-                    req["reality_type"],
-                    req.get("context")
-                )
-            elif req_type == "npc":
-                task = self.generate_npc_dialogue(
-                    req["npc_name"],
-                    req["context"],
-                    req["player_action"],
-                    req.get("npc_background")
-                )
-            elif req_type == "combat":
-                task = self.generate_combat_description(
-                    req["attacker"],
-                    req["defender"],
-                    req["action"],
-                    req["result"],
-                    req.get("damage"),
-                    req.get("special_effects")
-                )
-            elif req_type == "event":
-                task = self.generate_event_narrative(
-                    req["event_type"],
-                    req["context"]
-                )
+            handler = dispatch.get(req.type)
+            if handler is None:
+                logger.warning(f"Unknown request type: {req.type}")
+                tasks.append(asyncio.sleep(0))  # No-op
             else:
-                logger.warning(f"Unknown request type: {req_type}")
-                task = asyncio.create_task(asyncio.sleep(0))  # No-op task
-
-            tasks.append(task)
+                tasks.append(run(handler, req))
 
+        # If this coroutine is cancelled, gather cancels every in-flight request
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Convert exceptions to fallback text
+        # Convert timeouts and exceptions to fallback text
         final_results = []
         for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch request {i} failed: {result}")
-                final_results.append(get_fallback_text(PromptType.LOCATION_DESCRIPTION))
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(f"Batch request {i} timed out after {self.timeout:.1f}s")
+                final_results.append(self._get_batch_fallback(requests[i]))
+            elif isinstance(result, BaseException):
+                logger.error(f"Batch request {i} failed: {result!r}")
+                final_results.append(self._get_batch_fallback(requests[i]))
             else:
                 final_results.append(result)
 
         return final_results
 
+    def _location_request(self, req: GenerationRequest):
+        """Start location generation for a batch request."""
+        return self.generate_location_description(
+            req.location_name,
+            req.reality_type,
+            req.context
+        )
+
+    def _npc_request(self, req: GenerationRequest):
+        """Start NPC dialogue generation for a batch request."""
+        return self.generate_npc_dialogue(
+            req.npc_name,
+            req.context,
+            req.player_action,
+            req.npc_background
+        )
+
+    def _combat_request(self, req: GenerationRequest):
+        """Start combat description generation for a batch request."""
+        return self.generate_combat_description(
+            req.attacker,
+            req.defender,
+            req.action,
+            req.result,
+            req.damage,
+            req.special_effects
+        )
+
+    def _event_request(self, req: GenerationRequest):
+        """Start event narrative generation for a batch request."""
+        return self.generate_event_narrative(
+            req.event_type,
+            req.context
+        )
+
+    def _get_batch_fallback(self, req: GenerationRequest) -> str:
+        """Get fallback text matching a batch request's type."""
+        req_type = req.type
+        if req_type == "npc":
+            return get_fallback_text(PROMPT_NPC)
+        elif req_type == "combat":
+            return get_fallback_text(PROMPT_COMBAT, req.result)
+        elif req_type == "event":
+            return get_fallback_text(PROMPT_EVENT, req.event_type)
+        return get_fallback_text(PROMPT_LOCATION, req.reality_type)
+
     # ===========================
     # Utility Methods
     # ===========================
 
+    @property
+    def request_count(self) -> int:
+        """Number of successful provider requests made so far."""
+        return self._stats["request_count"]
+
     def clear_cache(self):
         """Clear the generation cache."""
         self._cache.clear()
+        self._stats["cache_size"] = 0
         logger.info("Cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get statistics about LLM usage.
 
+        The counters are maintained as state changes, so this is a plain copy.
+        Timeout and concurrency reflect the values configured at construction.
+
         Returns:
             Dictionary with usage statistics
         """
-        return {
-            "enabled": self.enabled,
-            "provider": self.provider.value,
-            "model": self.model,
-            "request_count": self._request_count,
-            "cache_size": len(self._cache),
-            "cache_max_size": self._cache_max_size
-        }
+        return self._stats.copy()
 
     def set_enabled(self, enabled: bool):
         """Enable or disable LLM generation."""
         self.enabled = enabled
+        self._stats["enabled"] = enabled
         logger.info(f"LLM generation {'enabled' if enabled else 'disabled'}")
 
     async def test_connection(self) -> bool:
@@ -580,6 +729,8 @@ def get_llm_generator() -> LLMGenerator:
 # ===========================
 # Synchronous Wrapper Functions
 # ===========================
+# When generation is disabled these return fallback text directly instead of
+# spinning up an event loop.
 
 def generate_location_description_sync(
     location_name: str,
@@ -591,6 +742,8 @@ def generate_location_description_sync(
     Uses asyncio.run() to execute async function.
     """
     generator = get_llm_generator()
+    if not generator.enabled:
+        return get_fallback_text(PROMPT_LOCATION, reality_type)
     return asyncio.run(
         generator.generate_location_description(location_name, reality_type, context)
     )
@@ -607,6 +760,8 @@ def generate_npc_dialogue_sync(
     Uses asyncio.run() to execute async function.
     """
     generator = get_llm_generator()
+    if not generator.enabled:
+        return get_fallback_text(PROMPT_NPC)
     return asyncio.run(
         generator.generate_npc_dialogue(npc_name, context, player_action, npc_background)
     )
@@ -625,6 +780,8 @@ def generate_combat_description_sync(
     Uses asyncio.run() to execute async function.
     """
     generator = get_llm_generator()
+    if not generator.enabled:
+        return get_fallback_text(PROMPT_COMBAT, result)
     return asyncio.run(
         generator.generate_combat_description(
             attacker, defender, action, result, damage, special_effects
@@ -641,6 +798,8 @@ def generate_event_narrative_sync(
     Uses asyncio.run() to execute async function.
     """
     generator = get_llm_generator()
+    if not generator.enabled:
+        return get_fallback_text(PROMPT_EVENT, event_type)
     return asyncio.run(
         generator.generate_event_narrative(event_type, context)
     )
@@ -2,9 +2,16 @@
 Prompt templates and context formatting for LLM text generation.
 Contains system prompts, templates, and formatting functions for the dark fantasy Souls-like tone.
 """
-from typing import Dict, Any, Optional
+import logging
+import random
+import string
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class PromptType(Enum):
     """Types of prompts for different scenarios."""
@@ -14,9 +21,17 @@ class PromptType(Enum):
     EVENT_NARRATIVE = "event_narrative"
 
 
+# Module-level aliases so hot paths skip the EnumMeta attribute lookup
+PROMPT_LOCATION = PromptType.LOCATION_DESCRIPTION
+PROMPT_NPC = PromptType.NPC_DIALOGUE
+PROMPT_COMBAT = PromptType.COMBAT_DESCRIPTION
+PROMPT_EVENT = PromptType.EVENT_NARRATIVE
+
+
 # ===========================
 # System Prompts
 # ===========================
+# Concatenated once at import; the format_* functions return these objects as-is.
 
 SYSTEM_PROMPT_BASE = """You are a narrative generator for "Shards of Eternity", a dark fantasy multiplayer game inspired by Dark Souls and cosmic horror.
 
@@ -142,6 +157,42 @@ CONTEXT: {context}
 Create an atmospheric narrative that captures the significance and mood of this event."""
 
 
+def _compile_template(template: str, *fields: str) -> Tuple[str, ...]:
+    """
+    Split a prompt template into the literal segments around its fields.
+
+    Args:
+        template: str.format-style template
+        fields: Expected field names, in template order
+
+    Returns:
+        Tuple of len(fields) + 1 literal strings to interleave with values
+    """
+    parsed = list(string.Formatter().parse(template))
+    names = tuple(field for _, field, _, _ in parsed if field is not None)
+    if names != fields:
+        raise ValueError(f"Template fields {names} do not match {fields}")
+    parts = tuple(literal for literal, _, _, _ in parsed)
+    # A template ending in a field yields no trailing literal
+    return parts if parsed[-1][1] is None else parts + ("",)
+
+
+# Templates pre-split at import so formatting is a single join per call
+_LOCATION_PARTS = _compile_template(
+    LOCATION_DESCRIPTION_TEMPLATE, "location_name", "reality_type", "context"
+)
+_NPC_PARTS = _compile_template(
+    NPC_DIALOGUE_TEMPLATE, "npc_name", "npc_background", "context", "player_action"
+)
+_COMBAT_PARTS = _compile_template(
+    COMBAT_DESCRIPTION_TEMPLATE,
+    "attacker", "defender", "action", "result", "damage", "special_effects"
+)
+_EVENT_PARTS = _compile_template(
+    EVENT_NARRATIVE_TEMPLATE, "event_type", "location", "participants", "details", "context"
+)
+
+
 # ===========================
 # Context Formatting Functions
 # ===========================
@@ -179,11 +230,12 @@ def format_location_prompt(
 
     return {
         "system": SYSTEM_PROMPT_LOCATION,
-        "user": LOCATION_DESCRIPTION_TEMPLATE.format(
-            location_name=location_name,
-            reality_type=reality_type,
-            context=context_str
-        )
+        "user": "".join((
+            _LOCATION_PARTS[0], str(location_name),
+            _LOCATION_PARTS[1], str(reality_type),
+            _LOCATION_PARTS[2], context_str,
+            _LOCATION_PARTS[3],
+        ))
     }
 
 
@@ -210,12 +262,13 @@ def format_npc_dialogue_prompt(
 
     return {
         "system": SYSTEM_PROMPT_NPC,
-        "user": NPC_DIALOGUE_TEMPLATE.format(
-            npc_name=npc_name,
-            npc_background=npc_background,
-            context=context,
-            player_action=player_action
-        )
+        "user": "".join((
+            _NPC_PARTS[0], str(npc_name),
+            _NPC_PARTS[1], str(npc_background),
+            _NPC_PARTS[2], str(context),
+            _NPC_PARTS[3], str(player_action),
+            _NPC_PARTS[4],
+        ))
     }
 
 
@@ -246,14 +299,15 @@ def format_combat_prompt(
 
     return {
         "system": SYSTEM_PROMPT_COMBAT,
-        "user": COMBAT_DESCRIPTION_TEMPLATE.format(
-            attacker=attacker,
-            defender=defender,
-            action=action,
-            result=result,
-            damage=damage_str,
-            special_effects=effects_str
-        )
+        "user": "".join((
+            _COMBAT_PARTS[0], str(attacker),
+            _COMBAT_PARTS[1], str(defender),
+            _COMBAT_PARTS[2], str(action),
+            _COMBAT_PARTS[3], str(result),
+            _COMBAT_PARTS[4], damage_str,
+            _COMBAT_PARTS[5], str(effects_str),
+            _COMBAT_PARTS[6],
+        ))
     }
 
 
@@ -282,21 +336,19 @@ def format_event_prompt(
     else:
         participants_str = str(participants)
 
-    # Format details
-    details_items = []
-    for key, value in details.items():
-        details_items.append(f"{key}: {value}")
-    details_str = "\n".join(details_items) if details_items else "None"
+    # Format details in a single join (an empty mapping joins to "")
+    details_str = "\n".join([f"{key}: {value}" for key, value in details.items()]) or "None"
 
     return {
         "system": SYSTEM_PROMPT_EVENT,
-        "user": EVENT_NARRATIVE_TEMPLATE.format(
-            event_type=event_type,
-            location=location,
-            participants=participants_str,
-            details=details_str,
-            context=additional_context
-        )
+        "user": "".join((
+            _EVENT_PARTS[0], str(event_type),
+            _EVENT_PARTS[1], str(location),
+            _EVENT_PARTS[2], participants_str,
+            _EVENT_PARTS[3], details_str,
+            _EVENT_PARTS[4], str(additional_context),
+            _EVENT_PARTS[5],
+        ))
     }
 
 
@@ -304,72 +356,92 @@ def format_event_prompt(
 # Fallback Text
 # ===========================
 
-FALLBACK_LOCATION_DESCRIPTIONS = {
+def _freeze(table: Dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only view of a fallback table with interned keys."""
+    return MappingProxyType({sys.intern(key): value for key, value in table.items()})
+
+
+FALLBACK_LOCATION_DESCRIPTIONS = _freeze({
     "default": "A place of shadow and mystery, shrouded in the dying light.",
     "stable": "The world holds together here, if barely. Reality clings to familiar forms.",
     "fractured": "Space warps and bends. What was solid becomes uncertain.",
     "corrupted": "The air itself writhes with wrongness. Reality has abandoned this place."
-}
+})
 
 
-FALLBACK_NPC_DIALOGUES = [
+FALLBACK_NPC_DIALOGUES = (
     "...",
     "The words escape me, traveler.",
     "Silence falls heavy here.",
     "I have nothing to offer you.",
     "Another lost soul, wandering.",
     "Speak your piece and be gone.",
-]
+)
 
 
-FALLBACK_COMBAT_DESCRIPTIONS = {
+FALLBACK_COMBAT_DESCRIPTIONS = _freeze({
     "hit": "The blow lands with brutal force.",
     "miss": "The strike cuts only air.",
     "critical": "A devastating strike tears through defenses.",
     "blocked": "Steel meets steel with a harsh clang.",
     "dodged": "They slip away like smoke.",
     "parried": "The attack is turned aside with practiced skill."
-}
+})
 
 
-FALLBACK_EVENT_NARRATIVES = {
+FALLBACK_EVENT_NARRATIVES = _freeze({
     "shard_collected": "Another fragment of eternity claimed. The cycle continues.",
     "aetherfall": "Reality shudders. The world remakes itself once more.",
     "boss_defeated": "The great beast falls. Silence reclaims the battlefield.",
     "player_death": "Darkness claims another soul.",
     "reality_shift": "The world twists. Nothing is as it was.",
     "default": "Something significant has occurred in the world."
-}
-
-
-def get_fallback_text(prompt_type: PromptType, key: Optional[str] = None) -> str:
+})
+
+# Bound lookups for the fallback hot path
+_randrange = random.randrange
+_NPC_LEN = len(FALLBACK_NPC_DIALOGUES)
+_NPC_ID = sys.intern(PROMPT_NPC.value)
+_UNKNOWN_FALLBACK = "The world continues, silent and mysterious."
+
+# Combined (prompt_type, key) -> text table, reachable by enum member or its string ID
+_FALLBACK: Dict[Tuple[Union[PromptType, str], str], str] = {}
+_DEFAULTS: Dict[Union[PromptType, str], str] = {}
+for _prompt_type, _table, _default_key in (
+    (PROMPT_LOCATION, FALLBACK_LOCATION_DESCRIPTIONS, "default"),
+    (PROMPT_COMBAT, FALLBACK_COMBAT_DESCRIPTIONS, "hit"),
+    (PROMPT_EVENT, FALLBACK_EVENT_NARRATIVES, "default"),
+):
+    for _type_key in (_prompt_type, sys.intern(_prompt_type.value)):
+        _DEFAULTS[_type_key] = _table[_default_key]
+        for _key, _text in _table.items():
+            _FALLBACK[(_type_key, _key)] = _text
+del _prompt_type, _table, _default_key, _type_key, _key, _text
+
+# Every known fallback key, interned; only consulted on the miss path
+_KEYS = frozenset(_key for _type_key, _key in _FALLBACK)
+
+
+def get_fallback_text(
+    prompt_type: Union[PromptType, str],
+    key: Optional[str] = None
+) -> str:
     """
     Get fallback text when LLM is unavailable.
 
     Args:
-        prompt_type: Type of prompt/content needed
+        prompt_type: Type of prompt/content needed (PromptType or its string value)
         key: Optional specific key for lookups
 
     Returns:
         Fallback text string
     """
-    if prompt_type == PromptType.LOCATION_DESCRIPTION:
-        return FALLBACK_LOCATION_DESCRIPTIONS.get(
-            key or "default",
-            FALLBACK_LOCATION_DESCRIPTIONS["default"]
-        )
-    elif prompt_type == PromptType.NPC_DIALOGUE:
-        import random
-        return random.choice(FALLBACK_NPC_DIALOGUES)
-    elif prompt_type == PromptType.COMBAT_DESCRIPTION:
-        return FALLBACK_COMBAT_DESCRIPTIONS.get(
-            key or "hit",
-            FALLBACK_COMBAT_DESCRIPTIONS["hit"]
-        )
-    elif prompt_type == PromptType.EVENT_NARRATIVE:
-        return FALLBACK_EVENT_NARRATIVES.get(
-            key or "default",
-            FALLBACK_EVENT_NARRATIVES["default"]
-        )
-    else:
-        return "The world continues, silent and mysterious."
+    # NPC dialogue is random rather than keyed
+    if prompt_type is PROMPT_NPC or prompt_type == _NPC_ID:
+        return FALLBACK_NPC_DIALOGUES[_randrange(_NPC_LEN)]
+    try:
+        return _FALLBACK[(prompt_type, key)]
+    except KeyError:
+        if key is not None and key not in _KEYS:
+            logger.debug("Unknown fallback key %r for %s, using default", key, prompt_type)
+        return _DEFAULTS.get(prompt_type, _UNKNOWN_FALLBACK)
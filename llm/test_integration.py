@@ -4,12 +4,23 @@ Tests fallback functionality without requiring API keys.
 """
 import asyncio
 import sys
+import time
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from llm.generator import LLMGenerator, get_llm_generator
+# Add parent directory to path (once, even if the module is re-imported)
+_PKG_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PKG_ROOT not in sys.path:
+    sys.path.insert(0, _PKG_ROOT)
+
+from llm.generator import (
+    LLMGenerator,
+    GenerationRequest,
+    get_llm_generator,
+    generate_location_description_sync,
+    generate_combat_description_sync,
+)
 from llm.prompts import get_fallback_text, PromptType
 
 
@@ -55,6 +66,7 @@ def test_fallback_text():
     print("All fallback tests passed!\n")
 
 
+@pytest.mark.asyncio
 async def test_generator_with_disabled_llm():
     """Test generator with LLM disabled (uses fallbacks)."""
     print("Testing LLMGenerator with LLM disabled...")
@@ -102,6 +114,26 @@ async def test_generator_with_disabled_llm():
     print("All generator tests passed!\n")
 
 
+def test_sync_wrappers_with_disabled_llm():
+    """Test that sync wrappers return fallbacks without an event loop when disabled."""
+    print("Testing sync wrappers with LLM disabled...")
+
+    generator = get_llm_generator()
+    was_enabled = generator.enabled
+    generator.set_enabled(False)
+    try:
+        location = generate_location_description_sync("Area 1", "fractured")
+        combat = generate_combat_description_sync("Player", "Enemy", "slash", "parried")
+    finally:
+        generator.set_enabled(was_enabled)
+
+    assert location == get_fallback_text(PromptType.LOCATION_DESCRIPTION, "fractured")
+    assert combat == get_fallback_text(PromptType.COMBAT_DESCRIPTION, "parried")
+    print("  ✓ Sync wrappers short-circuit to fallbacks")
+    print("Sync wrapper tests passed!\n")
+
+
+@pytest.mark.asyncio
 async def test_batch_generation():
     """Test batch generation with disabled LLM."""
     print("Testing batch generation...")
@@ -137,6 +169,100 @@ async def test_batch_generation():
     print("Batch generation tests passed!\n")
 
 
+@pytest.mark.asyncio
+async def test_batch_timeout_fallback():
+    """Test that a slow request degrades to fallback without stalling the batch."""
+    print("Testing batch timeout fallback...")
+
+    generator = LLMGenerator()
+    generator.set_enabled(True)  # Disabled generators return fallbacks before any timeout
+    generator.timeout = 0.05
+    calls = []
+
+    async def slow_generate(*args, **kwargs):
+        calls.append(1)
+        await asyncio.sleep(10)
+
+    generator._generate = slow_generate
+
+    requests = [
+        {"type": "event", "event_type": "aetherfall", "context": {}},
+        GenerationRequest(type="combat", attacker="A", defender="B", action="strike", result="miss"),
+    ]
+    started = time.monotonic()
+    results = await generator.generate_multiple_descriptions(requests)
+    elapsed = time.monotonic() - started
+
+    assert len(calls) == 2
+    assert elapsed < 1.0
+    assert results[0] == get_fallback_text(PromptType.EVENT_NARRATIVE, "aetherfall")
+    assert results[1] == get_fallback_text(PromptType.COMBAT_DESCRIPTION, "miss")
+    print("  ✓ Timed-out requests fall back per request type")
+    print("Batch timeout tests passed!\n")
+
+
+@pytest.mark.asyncio
+async def test_batch_concurrency_limit():
+    """Test that batch generation keeps provider calls under the concurrency cap."""
+    print("Testing batch concurrency limit...")
+
+    generator = LLMGenerator()
+    generator.set_enabled(True)
+    generator.max_concurrency = 2
+    active = peak = 0
+
+    async def tracked_generate(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "generated"
+
+    generator._generate = tracked_generate
+
+    requests = [
+        GenerationRequest(type="combat", attacker="A", defender="B", action="strike", result="hit")
+        for _ in range(6)
+    ]
+    results = await generator.generate_multiple_descriptions(requests)
+
+    assert results == ["generated"] * 6
+    assert peak == 2
+    print(f"  ✓ Peak concurrency held at {peak}")
+    print("Batch concurrency tests passed!\n")
+
+
+@pytest.mark.asyncio
+async def test_batch_missing_fields_fallback():
+    """Test that requests missing required fields fall back without a provider call."""
+    print("Testing batch missing-field fallback...")
+
+    generator = LLMGenerator()
+    generator.set_enabled(True)
+    prompts = []
+
+    async def recording_generate(system_prompt, user_prompt, cache_key=None):
+        prompts.append(user_prompt)
+        return "generated"
+
+    generator._generate = recording_generate
+
+    requests = [
+        {"type": "combat", "attacker": "A", "defender": "B", "result": "miss"},
+        {"type": "event", "event_type": "aetherfall"},
+        {"type": "location", "location_name": "Area 1", "reality_type": "stable"},
+    ]
+    results = await generator.generate_multiple_descriptions(requests)
+
+    assert results[0] == get_fallback_text(PromptType.COMBAT_DESCRIPTION, "miss")
+    assert results[1] == get_fallback_text(PromptType.EVENT_NARRATIVE, "aetherfall")
+    assert results[2] == "generated"
+    assert len(prompts) == 1 and "Area 1" in prompts[0]
+    print("  ✓ Incomplete requests fall back per request type")
+    print("Batch missing-field tests passed!\n")
+
+
 def test_generator_stats():
     """Test stats tracking."""
     print("Testing stats tracking...")
@@ -150,6 +276,22 @@ def test_generator_stats():
     assert "request_count" in stats
     assert "cache_size" in stats
 
+    # Reading the counter must not advance it
+    count = generator.request_count
+    assert generator.request_count == count
+    generator._stats["request_count"] += 1
+    assert generator.request_count == count + 1
+    assert generator.get_stats()["request_count"] == count + 1
+
+    # Stats track state changes without being rebuilt
+    was_enabled = generator.enabled
+    generator.set_enabled(not was_enabled)
+    assert generator.get_stats()["enabled"] is (not was_enabled)
+    generator.set_enabled(was_enabled)
+
+    generator._add_to_cache(("stats", "key"), "value")
+    assert generator.get_stats()["cache_size"] == len(generator._cache)
+
     print(f"  ✓ Stats: {stats}")
     print("Stats tests passed!\n")
 
@@ -168,9 +310,22 @@ def test_cache_management():
 
     # Test cache key creation
     key = generator._make_cache_key("test", "value", 123)
-    assert key == "test|value|123"
+    assert key == ("test", "value", 123)
     print("  ✓ Cache key creation works")
 
+    # Least recently used entries are evicted first
+    generator._cache_max_size = 2
+    generator._add_to_cache(("a",), "A")
+    generator._add_to_cache(("b",), "B")
+    assert generator._get_from_cache(("a",)) == "A"
+    generator._add_to_cache(("c",), "C")
+    assert generator._get_from_cache(("b",)) is None
+    assert generator._get_from_cache(("a",)) == "A"
+    assert generator.get_stats()["cache_size"] == 2
+    generator._cache_max_size = generator._stats["cache_max_size"]
+    generator.clear_cache()
+    print("  ✓ LRU eviction works")
+
     print("Cache tests passed!\n")
 
 
@@ -188,9 +343,21 @@ async def main():
         # Test generator with disabled LLM
         await test_generator_with_disabled_llm()
 
+        # Test sync wrappers with disabled LLM
+        test_sync_wrappers_with_disabled_llm()
+
         # Test batch generation
         await test_batch_generation()
 
+        # Test batch timeouts
+        await test_batch_timeout_fallback()
+
+        # Test batch concurrency limit
+        await test_batch_concurrency_limit()
+
+        # Test batch missing-field fallback
+        await test_batch_missing_fields_fallback()
+
         # Test stats
         test_generator_stats()
 
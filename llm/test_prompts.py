@@ -5,8 +5,10 @@ Tests prompt formatting and fallback text without requiring settings or API clie
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add this directory to path (once, even if the module is re-imported)
+_LLM_DIR = str(Path(__file__).resolve().parent)
+if _LLM_DIR not in sys.path:
+    sys.path.insert(0, _LLM_DIR)
 
 from prompts import (
     format_location_prompt,
@@ -20,6 +22,10 @@ from prompts import (
     SYSTEM_PROMPT_NPC,
     SYSTEM_PROMPT_COMBAT,
     SYSTEM_PROMPT_EVENT,
+    LOCATION_DESCRIPTION_TEMPLATE,
+    NPC_DIALOGUE_TEMPLATE,
+    COMBAT_DESCRIPTION_TEMPLATE,
+    EVENT_NARRATIVE_TEMPLATE,
 )
 
 
@@ -43,6 +49,12 @@ def test_system_prompts():
     assert len(SYSTEM_PROMPT_EVENT) > 0
     assert SYSTEM_PROMPT_BASE in SYSTEM_PROMPT_EVENT
 
+    # Formatters hand back the import-time constants, never a rebuilt copy
+    assert format_location_prompt("Keep", "stable")["system"] is SYSTEM_PROMPT_LOCATION
+    assert format_npc_dialogue_prompt("Seer", "Dusk", "waves")["system"] is SYSTEM_PROMPT_NPC
+    assert format_combat_prompt("A", "B", "slash", "hit")["system"] is SYSTEM_PROMPT_COMBAT
+    assert format_event_prompt("aetherfall", {})["system"] is SYSTEM_PROMPT_EVENT
+
     print("  [OK] All system prompts defined and valid")
 
 
@@ -158,6 +170,31 @@ def test_format_event_prompt():
     print("  [OK] Event prompt")
 
 
+def test_compiled_templates_match_format():
+    """Test that pre-split templates render exactly like str.format."""
+    print("\nTesting compiled templates...")
+
+    assert format_location_prompt("Keep", "stable")["user"] == \
+        LOCATION_DESCRIPTION_TEMPLATE.format(
+            location_name="Keep", reality_type="stable", context="None"
+        )
+    assert format_npc_dialogue_prompt("Seer", "Dusk", "waves", "Oracle")["user"] == \
+        NPC_DIALOGUE_TEMPLATE.format(
+            npc_name="Seer", npc_background="Oracle", context="Dusk", player_action="waves"
+        )
+    assert format_combat_prompt("A", "B", "slash", "hit", 12)["user"] == \
+        COMBAT_DESCRIPTION_TEMPLATE.format(
+            attacker="A", defender="B", action="slash", result="hit",
+            damage="12 damage", special_effects="None"
+        )
+    assert format_event_prompt("aetherfall", {"location": "Spire"})["user"] == \
+        EVENT_NARRATIVE_TEMPLATE.format(
+            event_type="aetherfall", location="Spire", participants="Unknown",
+            details="None", context=""
+        )
+    print("  [OK] Compiled templates match str.format output")
+
+
 def test_fallback_text():
     """Test fallback text generation."""
     print("\nTesting fallback text...")
@@ -180,6 +217,8 @@ def test_fallback_text():
     npc2 = get_fallback_text(PromptType.NPC_DIALOGUE)
     assert npc1
     # Note: May be the same due to random choice, that's OK
+    # NPC dialogue must not be served from the fallback cache
+    assert len({get_fallback_text(PromptType.NPC_DIALOGUE) for _ in range(200)}) > 1
     print("  [OK] NPC dialogue fallbacks")
 
     # Combat fallbacks
@@ -207,6 +246,11 @@ def test_fallback_text():
     assert event_default
     print("  [OK] Event fallbacks")
 
+    # String prompt type IDs resolve to the same fallbacks
+    assert get_fallback_text("combat_description", "miss") == combat_miss
+    assert get_fallback_text("event_narrative", "aetherfall") == event_aetherfall
+    print("  [OK] String prompt type fallbacks")
+
 
 def main():
     """Run all tests."""
@@ -221,6 +265,7 @@ def main():
         test_format_npc_dialogue_prompt()
         test_format_combat_prompt()
         test_format_event_prompt()
+        test_compiled_templates_match_format()
         test_fallback_text()
 
         print("\n" + "=" * 60)
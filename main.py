@@ -22,435 +22,162 @@ Usage:
 import argparse
 import asyncio
 import logging
+import logging.handlers
 import signal
 import sys
-import time
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
-
-from textual.app import App, ComposeResult
-from textual.screen import Screen
-from textual.widgets import Header, Footer, Static, Button, ListView, ListItem
-from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
-from textual.binding import Binding
-
-# Database imports
-from database import init_database, reset_database, get_db_session
-from database.models import (
-    Character, CrystalShard, WorldState, Location, WorldEvent,
-    RaceType, ClassType, FactionType, RealityType, InventoryItem
-)
-
-# System imports
-from characters.character import CharacterCreator, CharacterManager
-from world.shards import ShardManager
-from combat.system import CombatSystem
-from llm.generator import get_llm_generator
-from network.master_server import MasterServer
-from config.settings import get_settings
-
-# TUI screens
-from tui.main_screen import MainGameScreen
-from tui.character_screen import CharacterCreationScreen, CharacterSheetScreen
-from tui.world_screen import WorldScreen
-from tui.combat_screen import CombatScreen
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/shards.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from typing import Dict, Optional
+
+# Heavy subsystems (Textual, SQLAlchemy models, networking) are imported
+# inside the functions that need them, so each CLI mode only pays for the
+# modules it actually uses.
+
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for a CLI run.
+
+    Called from main() once arguments are parsed, so importing this module
+    (or running --help) never touches the log file. The file handler is
+    created with delay=True and only opens the file on first emit.
+    """
+    Path("logs").mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.handlers.RotatingFileHandler(
+                'logs/shards.log',
+                maxBytes=5 * 1024 * 1024,
+                backupCount=3,
+                delay=True
+            ),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
 # ============================================================================
 # INITIAL DATA SEEDING
 # ============================================================================
 
 def seed_crystal_shards(session) -> None:
     """Create the 12 Crystal Shards in the database."""
+    from sqlalchemy import insert
+    from database.models import CrystalShard
+    from database.seed_data import SHARD_DATA
+
     logger.info("Seeding Crystal Shards...")
 
     # Check if shards already exist
-    existing = session.query(CrystalShard).count()
-    if existing > 0:
-        logger.info(f"Crystal Shards already exist ({existing} shards). Skipping seed.")
+    if session.query(CrystalShard.id).first() is not None:
+        logger.info("Crystal Shards already exist. Skipping seed.")
         return
 
-    shard_data = [
-        {
-            "shard_number": 1,
-            "shard_name": "Phoenix Flame",
-            "description": "A blazing crystal that burns with eternal fire",
-            "reality_influence": "Fire and Rebirth",
-            "guardian_boss_name": "Ignarok the Eternal",
-            "power_level": 100
-        },
-        {
-            "shard_number": 2,
-            "shard_name": "Ocean's Tear",
-            "description": "A sapphire crystal containing the primordial ocean",
-            "reality_influence": "Water and Adaptation",
-            "guardian_boss_name": "Thalassia the Depths",
-            "power_level": 100
-        },
-        {
-            "shard_number": 3,
-            "shard_name": "Mountain's Core",
-            "description": "Crystallized heart of the world's first mountain",
-            "reality_influence": "Earth and Endurance",
-            "guardian_boss_name": "Terrakor the Unmoved",
-            "power_level": 100
-        },
-        {
-            "shard_number": 4,
-            "shard_name": "Tempest Crown",
-            "description": "A crystal filled with eternal storms and lightning",
-            "reality_influence": "Air and Freedom",
-            "guardian_boss_name": "Zephyrath the Hurricane",
-            "power_level": 100
-        },
-        {
-            "shard_number": 5,
-            "shard_name": "Dawn's Radiance",
-            "description": "A brilliant crystal containing the first sunrise",
-            "reality_influence": "Light and Truth",
-            "guardian_boss_name": "Solarius the Radiant",
-            "power_level": 100
-        },
-        {
-            "shard_number": 6,
-            "shard_name": "Void Heart",
-            "description": "A black crystal that absorbs all light and hope",
-            "reality_influence": "Darkness and Fear",
-            "guardian_boss_name": "Nocturnyx the Void",
-            "power_level": 100
-        },
-        {
-            "shard_number": 7,
-            "shard_name": "Null Sphere",
-            "description": "A crystal that shouldn't exist, yet does",
-            "reality_influence": "Void and Unmaking",
-            "guardian_boss_name": "The Unmade",
-            "power_level": 100
-        },
-        {
-            "shard_number": 8,
-            "shard_name": "Hourglass Eternal",
-            "description": "A crystal containing all moments simultaneously",
-            "reality_influence": "Time and Fate",
-            "guardian_boss_name": "Chronovax the Timeless",
-            "power_level": 100
-        },
-        {
-            "shard_number": 9,
-            "shard_name": "Infinity Prism",
-            "description": "A crystal containing infinite space within finite form",
-            "reality_influence": "Space and Distance",
-            "guardian_boss_name": "Infinitus the Boundless",
-            "power_level": 100
-        },
-        {
-            "shard_number": 10,
-            "shard_name": "Genesis Seed",
-            "description": "The first spark of life crystallized",
-            "reality_influence": "Life and Growth",
-            "guardian_boss_name": "Vitaera the Ever-Growing",
-            "power_level": 100
-        },
-        {
-            "shard_number": 11,
-            "shard_name": "Reaper's Eye",
-            "description": "A crystal containing the final breath of all things",
-            "reality_influence": "Death and Entropy",
-            "guardian_boss_name": "Mortifax the Final",
-            "power_level": 100
-        },
-        {
-            "shard_number": 12,
-            "shard_name": "Entropy Engine",
-            "description": "Pure chaos crystallized into unstable form",
-            "reality_influence": "Chaos and Randomness",
-            "guardian_boss_name": "Chaoticus the Random",
-            "power_level": 100
-        }
-    ]
-
-    for shard_info in shard_data:
-        shard = CrystalShard(**shard_info)
-        session.add(shard)
-
-    session.commit()
-    logger.info(f"Successfully created {len(shard_data)} Crystal Shards")
-
-
-def seed_locations(session) -> None:
-    """Create initial game locations."""
+    # One executemany INSERT; column defaults still apply, ORM instances are skipped
+    session.execute(insert(CrystalShard), [dict(row) for row in SHARD_DATA])
+    logger.info(f"Successfully created {len(SHARD_DATA)} Crystal Shards")
+
+
+def seed_locations(session) -> Dict[str, int]:
+    """
+    Create initial game locations.
+
+    Returns:
+        Mapping of location name -> id for the seeded locations (empty if skipped)
+    """
+    from sqlalchemy import insert
+    from database.models import CrystalShard, Location
+    from database.seed_data import LOCATION_DATA, SHARD_LOCATIONS
+
     logger.info("Seeding locations...")
 
     # Check if locations already exist
-    existing = session.query(Location).count()
-    if existing > 0:
-        logger.info(f"Locations already exist ({existing} locations). Skipping seed.")
-        return
+    if session.query(Location.id).first() is not None:
+        logger.info("Locations already exist. Skipping seed.")
+        return {}
+
+    session.execute(insert(Location), [dict(row) for row in LOCATION_DATA])
+    logger.info(f"Successfully created {len(LOCATION_DATA)} locations")
 
-    locations_data = [
-        {
-            "name": "The Nexus",
-            "description": "A neutral hub where all factions meet. The Crystal Shards pulse with energy here.",
-            "zone_type": "town",
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["Merchant", "Blacksmith", "Innkeeper", "Lorekeeper"]',
-            "connected_locations": '[]'
-        },
-        {
-            "name": "Ember Volcano",
-            "description": "An active volcano shrouded in perpetual flame. Home to the Phoenix Flame shard.",
-            "zone_type": "dungeon",
-            "is_safe_zone": False,
-            "danger_level": 8,
-            "enemy_types": '["Fire Elemental", "Lava Beast", "Flame Wraith"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Abyssal Trench",
-            "description": "The deepest point of the ocean, where pressure crushes all but the worthy.",
-            "zone_type": "dungeon",
-            "is_safe_zone": False,
-            "danger_level": 8,
-            "enemy_types": '["Sea Serpent", "Deep One", "Pressure Wraith"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Titan's Spine Mountains",
-            "description": "Impossibly tall mountains that pierce the clouds. Stone golems guard ancient secrets.",
-            "zone_type": "dungeon",
-            "is_safe_zone": False,
-            "danger_level": 9,
-            "enemy_types": '["Stone Golem", "Mountain Troll", "Avalanche Spirit"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Crimson Cathedral",
-            "description": "Headquarters of the Crimson Covenant. Blood magic permeates the air.",
-            "zone_type": "faction_hq",
-            "faction_controlled": FactionType.CRIMSON_COVENANT,
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["Blood Mage", "Covenant Leader", "Ritual Master"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Aether Academy",
-            "description": "The grand library and research center of the Aether Seekers.",
-            "zone_type": "faction_hq",
-            "faction_controlled": FactionType.AETHER_SEEKERS,
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["Archmage", "Librarian", "Research Scholar"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Iron Foundry",
-            "description": "The massive industrial complex of the Iron Brotherhood. Machines never sleep.",
-            "zone_type": "faction_hq",
-            "faction_controlled": FactionType.IRON_BROTHERHOOD,
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["Engineer", "Forgemaster", "Automaton Technician"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Twilight Grove",
-            "description": "An ethereal forest caught between day and night, home to the Moonlit Circle.",
-            "zone_type": "faction_hq",
-            "faction_controlled": FactionType.MOONLIT_CIRCLE,
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["Druid Elder", "Moon Priestess", "Shapeshifter"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Shadow Sanctum",
-            "description": "Hidden in darkness, the Shadowborn lurk in the spaces between reality.",
-            "zone_type": "faction_hq",
-            "faction_controlled": FactionType.SHADOWBORN,
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["Shadow Master", "Assassin Trainer", "Void Walker"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Golden Citadel",
-            "description": "A shining fortress of divine light, bastion of the Golden Order.",
-            "zone_type": "faction_hq",
-            "faction_controlled": FactionType.GOLDEN_ORDER,
-            "is_safe_zone": True,
-            "danger_level": 0,
-            "npc_list": '["High Paladin", "Divine Oracle", "Holy Knight"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Wilderness Outpost",
-            "description": "A small camp in the untamed wilds. Adventurers gather here.",
-            "zone_type": "wilderness",
-            "is_safe_zone": False,
-            "danger_level": 3,
-            "enemy_types": '["Wolf", "Bandit", "Wild Beast"]',
-            "npc_list": '["Trader", "Scout"]',
-            "connected_locations": '["The Nexus"]'
-        },
-        {
-            "name": "Necropolis of Lost Souls",
-            "description": "An ancient city of the dead. The Reaper's Eye shard lies at its heart.",
-            "zone_type": "dungeon",
-            "is_safe_zone": False,
-            "danger_level": 9,
-            "enemy_types": '["Undead Knight", "Lich", "Soul Harvester"]',
-            "connected_locations": '["The Nexus"]'
-        }
-    ]
-
-    for loc_data in locations_data:
-        location = Location(**loc_data)
-        session.add(location)
-
-    session.commit()
-    logger.info(f"Successfully created {len(locations_data)} locations")
+    # One (name, id) query serves both shard assignment and the NPC seed
+    location_ids = dict(session.query(Location.name, Location.id))
 
     # Assign shards to locations
     logger.info("Assigning shards to locations...")
-    shard_locations = {
-        1: "Ember Volcano",
-        2: "Abyssal Trench",
-        3: "Titan's Spine Mountains",
-        11: "Necropolis of Lost Souls"
-    }
-
-    for shard_num, loc_name in shard_locations.items():
-        location = session.query(Location).filter_by(name=loc_name).first()
-        shard = session.query(CrystalShard).filter_by(shard_number=shard_num).first()
-        if location and shard:
-            shard.location_id = location.id
-
-    session.commit()
+    shards = session.query(CrystalShard).filter(
+        CrystalShard.shard_number.in_(SHARD_LOCATIONS)
+    )
+    for shard in shards:
+        location_id = location_ids.get(SHARD_LOCATIONS[shard.shard_number])
+        if location_id is not None:
+            shard.location_id = location_id
+
     logger.info("Shards assigned to locations")
 
+    return location_ids
+
 
 def seed_world_state(session) -> None:
     """Initialize world state."""
+    from sqlalchemy import insert
+    from database.models import RealityType, WorldState
+
     logger.info("Initializing world state...")
 
     # Check if world state exists
-    world_state = session.query(WorldState).first()
-    if world_state:
+    if session.query(WorldState.id).first() is not None:
         logger.info("World state already exists. Skipping initialization.")
         return
 
-    world_state = WorldState(
-        current_reality=RealityType.NEUTRAL,
-        reality_stability=100.0,
-        aetherfall_count=0,
-        total_aetherfalls=0,
-        active_players=0,
-        total_deaths=0,
-        total_souls_in_economy=0,
-        faction_shard_counts='{"Crimson Covenant": 0, "Aether Seekers": 0, "Iron Brotherhood": 0, "Moonlit Circle": 0, "Shadowborn": 0, "Golden Order": 0}'
+    session.execute(
+        insert(WorldState).values(
+            current_reality=RealityType.NEUTRAL,
+            reality_stability=100.0,
+            aetherfall_count=0,
+            total_aetherfalls=0,
+            active_players=0,
+            total_deaths=0,
+            total_souls_in_economy=0,
+            faction_shard_counts={"Crimson Covenant": 0, "Aether Seekers": 0, "Iron Brotherhood": 0, "Moonlit Circle": 0, "Shadowborn": 0, "Golden Order": 0}
+        )
     )
-    session.add(world_state)
-    session.commit()
     logger.info("World state initialized")
 
 
-def seed_sample_npcs(session) -> None:
-    """Create sample NPCs for the world."""
+def seed_sample_npcs(session, location_ids: Optional[Dict[str, int]] = None) -> None:
+    """
+    Create sample NPCs for the world.
+
+    Args:
+        session: Database session
+        location_ids: Location name -> id map from seed_locations, if it just ran
+    """
+    from sqlalchemy import insert
+    from database.models import Character, Location
+    from database.seed_data import NPC_DATA
+
     logger.info("Creating sample NPCs...")
 
     # Check if NPCs already exist
-    existing_npcs = session.query(Character).filter_by(is_player=False).count()
-    if existing_npcs > 0:
-        logger.info(f"NPCs already exist ({existing_npcs} NPCs). Skipping seed.")
+    if session.query(Character.id).filter_by(is_player=False).first() is not None:
+        logger.info("NPCs already exist. Skipping seed.")
         return
 
-    # Get The Nexus location
-    nexus = session.query(Location).filter_by(name="The Nexus").first()
-    location_id = nexus.id if nexus else None
-
-    npcs_data = [
-        {
-            "name": "Merchant Thane",
-            "is_player": False,
-            "race": RaceType.HUMAN,
-            "character_class": ClassType.ROGUE,
-            "faction": FactionType.GOLDEN_ORDER,
-            "level": 5,
-            "location_id": location_id,
-            "strength": 10,
-            "dexterity": 14,
-            "constitution": 12,
-            "intelligence": 16,
-            "wisdom": 13,
-            "charisma": 18
-        },
-        {
-            "name": "Blacksmith Gorin",
-            "is_player": False,
-            "race": RaceType.DWARF,
-            "character_class": ClassType.WARRIOR,
-            "faction": FactionType.IRON_BROTHERHOOD,
-            "level": 8,
-            "location_id": location_id,
-            "strength": 18,
-            "dexterity": 10,
-            "constitution": 16,
-            "intelligence": 12,
-            "wisdom": 14,
-            "charisma": 10
-        },
-        {
-            "name": "Lorekeeper Myra",
-            "is_player": False,
-            "race": RaceType.ELF,
-            "character_class": ClassType.SORCERER,
-            "faction": FactionType.AETHER_SEEKERS,
-            "level": 10,
-            "location_id": location_id,
-            "strength": 8,
-            "dexterity": 12,
-            "constitution": 10,
-            "intelligence": 18,
-            "wisdom": 16,
-            "charisma": 14
-        },
-        {
-            "name": "Shadow Whisper",
-            "is_player": False,
-            "race": RaceType.TIEFLING,
-            "character_class": ClassType.ROGUE,
-            "faction": FactionType.SHADOWBORN,
-            "level": 12,
-            "location_id": location_id,
-            "strength": 12,
-            "dexterity": 18,
-            "constitution": 14,
-            "intelligence": 14,
-            "wisdom": 10,
-            "charisma": 16
-        }
-    ]
-
-    for npc_data in npcs_data:
-        npc = Character(**npc_data)
-        session.add(npc)
-
-    session.commit()
-    logger.info(f"Successfully created {len(npcs_data)} NPCs")
+    # Get The Nexus location, querying only if the locations seed was skipped
+    if location_ids and "The Nexus" in location_ids:
+        location_id = location_ids["The Nexus"]
+    else:
+        nexus = session.query(Location).filter_by(name="The Nexus").first()
+        location_id = nexus.id if nexus else None
+
+    session.execute(
+        insert(Character),
+        [{**row, "location_id": location_id} for row in NPC_DATA]
+    )
+    logger.info(f"Successfully created {len(NPC_DATA)} NPCs")
 
 
 def initialize_game_data(reset: bool = False) -> None:
@@ -460,6 +187,8 @@ def initialize_game_data(reset: bool = False) -> None:
     Args:
         reset: If True, drop all tables and recreate them
     """
+    from database import init_database, reset_database, get_db_session
+
     logger.info("Initializing game data...")
 
     if reset:
@@ -468,283 +197,26 @@ def initialize_game_data(reset: bool = False) -> None:
     else:
         init_database()
 
-    # Seed all initial data
+    # Seed all initial data in one transaction; get_db_session commits once on
+    # exit and rolls everything back if any seeder fails
     with get_db_session() as session:
         seed_crystal_shards(session)
-        seed_locations(session)
+        location_ids = seed_locations(session)
         seed_world_state(session)
-        seed_sample_npcs(session)
+        seed_sample_npcs(session, location_ids)
 
     logger.info("Game data initialization complete!")
 
 
-# ============================================================================
-# CHARACTER SELECTION SCREEN
-# ============================================================================
-
-class CharacterSelectionScreen(Screen):
-    """Screen for selecting or creating a character."""
-
-    BINDINGS = [
-        Binding("escape", "quit", "Quit"),
-        Binding("n", "new_character", "New Character"),
-    ]
-
-    DEFAULT_CSS = """
-    CharacterSelectionScreen {
-        layout: vertical;
-        align: center middle;
-    }
-
-    #selection-container {
-        width: 80;
-        height: 30;
-        border: solid $primary;
-        padding: 2;
-    }
-
-    #title {
-        text-align: center;
-        text-style: bold;
-        background: $primary;
-        color: $text;
-        padding: 1;
-        margin-bottom: 2;
-    }
-
-    #character-list {
-        height: 1fr;
-        margin-bottom: 2;
-    }
-
-    #button-container {
-        height: 5;
-        align: center middle;
-    }
-
-    .char-button {
-        margin: 0 1;
-        min-width: 20;
-    }
-    """
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.characters = []
-
-    def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
-
-        with Container(id="selection-container"):
-            yield Static("SHARDS OF ETERNITY", id="title")
-            yield Static("Select a character or create a new one:", id="subtitle")
-
-            with ScrollableContainer(id="character-list"):
-                yield ListView(id="char-list")
-
-            with Horizontal(id="button-container"):
-                yield Button("New Character", id="btn-new", variant="primary", classes="char-button")
-                yield Button("Delete", id="btn-delete", variant="error", classes="char-button")
-                yield Button("Quit", id="btn-quit", classes="char-button")
-
-        yield Footer()
-
-    def on_mount(self) -> None:
-        """Load characters when screen mounts."""
-        self.load_characters()
-
-    def load_characters(self) -> None:
-        """Load all player characters from database."""
-        try:
-            with get_db_session() as session:
-                self.characters = session.query(Character).filter_by(is_player=True).all()
-
-                char_list = self.query_one("#char-list", ListView)
-                char_list.clear()
-
-                if self.characters:
-                    for char in self.characters:
-                        char_text = (
-                            f"[bold cyan]{char.name}[/] - "
-                            f"Lvl {char.level} {char.race.value} {char.character_class.value} | "
-                            f"[yellow]{char.faction.value}[/]"
-                        )
-                        char_list.append(ListItem(Static(char_text), name=str(char.id)))
-                else:
-                    char_list.append(ListItem(Static("[dim]No characters found. Create your first character![/]")))
-
-        except Exception as e:
-            logger.error(f"Error loading characters: {e}")
-            self.app.notify(f"Error loading characters: {e}", severity="error")
-
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        """Handle character selection."""
-        if event.item.name and event.item.name.isdigit():
-            character_id = int(event.item.name)
-            try:
-                with get_db_session() as session:
-                    character = session.query(Character).filter_by(id=character_id).first()
-                    if character:
-                        char_data = character.to_dict()
-                        self.app.selected_character = char_data
-                        self.app.push_screen(MainGameScreen(char_data))
-            except Exception as e:
-                logger.error(f"Error selecting character: {e}")
-                self.app.notify(f"Error selecting character: {e}", severity="error")
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button presses."""
-        if event.button.id == "btn-new":
-            self.action_new_character()
-        elif event.button.id == "btn-delete":
-            self.delete_selected_character()
-        elif event.button.id == "btn-quit":
-            self.app.exit()
-
-    def action_new_character(self) -> None:
-        """Open character creation screen."""
-        def on_character_created(char_data):
-            # Create character in database
-            try:
-                creator = CharacterCreator()
-                # Create base stats
-                base_stats = {
-                    "strength": char_data["stats"]["strength"],
-                    "dexterity": char_data["stats"]["dexterity"],
-                    "constitution": char_data["stats"]["constitution"],
-                    "intelligence": char_data["stats"]["intelligence"],
-                    "wisdom": char_data["stats"]["wisdom"],
-                    "charisma": char_data["stats"]["charisma"]
-                }
-
-                character = creator.create_character(
-                    name=char_data["name"],
-                    race=RaceType[char_data["race"].upper()],
-                    character_class=ClassType[char_data["class"].upper()],
-                    faction=FactionType[char_data["faction"].upper().replace(" ", "_")],
-                    stats=base_stats,
-                    description=char_data.get("description", "")
-                )
-
-                self.app.notify(f"Character '{character.name}' created successfully!", severity="success")
-                self.load_characters()
-            except Exception as e:
-                logger.error(f"Error creating character: {e}")
-                self.app.notify(f"Error creating character: {e}", severity="error")
-
-        self.app.push_screen(CharacterCreationScreen(on_complete=on_character_created))
-
-    def delete_selected_character(self) -> None:
-        """Delete the selected character."""
-        char_list = self.query_one("#char-list", ListView)
-        if char_list.index is not None and char_list.index >= 0:
-            selected_item = char_list.children[char_list.index]
-            if hasattr(selected_item, 'name') and selected_item.name and selected_item.name.isdigit():
-                character_id = int(selected_item.name)
-                try:
-                    with get_db_session() as session:
-                        character = session.query(Character).filter_by(id=character_id).first()
-                        if character:
-                            char_name = character.name
-                            session.delete(character)
-                            session.commit()
-                            self.app.notify(f"Character '{char_name}' deleted", severity="warning")
-                            self.load_characters()
-                except Exception as e:
-                    logger.error(f"Error deleting character: {e}")
-                    self.app.notify(f"Error deleting character: {e}", severity="error")
-
-    def action_quit(self) -> None:
-        """Quit the application."""
-        self.app.exit()
-
-
-# ============================================================================
-# MAIN APPLICATION
-# ============================================================================
-
-class ShardsOfEternityApp(App):
-    """Main game application."""
-
-    TITLE = "Shards of Eternity"
-    CSS_PATH = None
-
-    BINDINGS = [
-        Binding("ctrl+q", "quit", "Quit Game"),
-        Binding("ctrl+s", "save", "Save Game"),
-    ]
-
-    def __init__(self, mode: str = "offline", **kwargs):
-        super().__init__(**kwargs)
-        self.mode = mode
-        self.selected_character: Optional[Dict[str, Any]] = None
-        self.autosave_interval = get_settings().autosave_interval
-        self.last_save_time = time.time()
-        self.master_server: Optional[MasterServer] = None
-        self.shutdown_event = asyncio.Event()
-
-    def on_mount(self) -> None:
-        """Initialize the app when mounted."""
-        logger.info(f"Starting Shards of Eternity in {self.mode} mode")
-
-        # Start with character selection
-        self.push_screen(CharacterSelectionScreen())
-
-        # Setup autosave
-        if self.mode == "offline":
-            self.set_interval(self.autosave_interval, self.autosave)
-
-    def action_save(self) -> None:
-        """Manual save action."""
-        self.save_game()
-        self.notify("Game saved!", severity="information")
-
-    def autosave(self) -> None:
-        """Automatic save handler."""
-        current_time = time.time()
-        if current_time - self.last_save_time >= self.autosave_interval:
-            self.save_game()
-            self.last_save_time = current_time
-            logger.info("Autosave completed")
-
-    def save_game(self) -> None:
-        """Save current game state."""
-        if not self.selected_character:
-            return
-
-        try:
-            with get_db_session() as session:
-                char_id = self.selected_character.get('id')
-                if char_id:
-                    character = session.query(Character).filter_by(id=char_id).first()
-                    if character:
-                        # Update character data
-                        # Note: This would be expanded to save current state
-                        character.updated_at = datetime.utcnow()
-                        session.commit()
-                        logger.debug(f"Saved character: {character.name}")
-        except Exception as e:
-            logger.error(f"Error saving game: {e}")
-
-    def action_quit(self) -> None:
-        """Handle graceful shutdown."""
-        logger.info("Initiating graceful shutdown...")
-
-        # Save game before quitting
-        if self.selected_character:
-            self.save_game()
-            logger.info("Final save completed")
-
-        # Cleanup and exit
-        self.exit()
-
-
 # ============================================================================
 # SERVER MODE
 # ============================================================================
 
 async def run_server_mode():
     """Run as master server."""
+    from database import init_database
+    from network.master_server import MasterServer
+
     logger.info("Starting Shards of Eternity Master Server...")
 
     # Initialize database
@@ -753,17 +225,25 @@ async def run_server_mode():
     # Create and start master server
     server = MasterServer()
 
-    def shutdown_handler(signum, frame):
+    # Signals only wake the main coroutine; the finally block does the stop
+    loop = asyncio.get_running_loop()
+    shutdown_event = asyncio.Event()
+
+    def shutdown_handler():
         logger.info("Received shutdown signal")
-        asyncio.create_task(server.stop())
+        shutdown_event.set()
 
-    signal.signal(signal.SIGINT, shutdown_handler)
-    signal.signal(signal.SIGTERM, shutdown_handler)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown_handler)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(shutdown_handler))
 
     try:
         await server.start()
         logger.info("Master server is running. Press Ctrl+C to stop.")
-        await asyncio.Event().wait()
+        await shutdown_event.wait()
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     finally:
@@ -777,6 +257,9 @@ async def run_server_mode():
 
 def run_client_mode():
     """Run as client connected to master server."""
+    from database import init_database
+    from tui.app import ShardsOfEternityApp
+
     logger.info("Starting Shards of Eternity Client...")
 
     # Initialize local database for caching
@@ -793,6 +276,10 @@ def run_client_mode():
 
 def run_offline_mode():
     """Run in single-player offline mode."""
+    from database import init_database, get_db_session
+    from database.models import CrystalShard
+    from tui.app import ShardsOfEternityApp
+
     logger.info("Starting Shards of Eternity (Offline Mode)...")
 
     # Initialize database
@@ -800,7 +287,7 @@ def run_offline_mode():
 
     # Seed initial data if needed
     with get_db_session() as session:
-        if session.query(CrystalShard).count() == 0:
+        if session.query(CrystalShard.id).first() is None:
             logger.info("No game data found. Seeding initial data...")
             initialize_game_data(reset=False)
 
@@ -860,8 +347,7 @@ Examples:
 
     args = parser.parse_args()
 
-    # Ensure logs directory exists
-    Path("logs").mkdir(exist_ok=True)
+    _configure_logging()
 
     # Handle reset database
     if args.reset_db:
@@ -877,6 +363,10 @@ Examples:
     # Handle character creation mode
     if args.create_character:
         logger.info("Starting character creation wizard...")
+        from textual.app import App
+        from database import init_database
+        from tui.character_screen import CharacterCreationScreen
+
         init_database()
 
         class CharCreatorApp(App):
@@ -892,6 +382,12 @@ Examples:
 
     # Determine mode
     if args.server:
+        # Optional: libuv-based event loop (not available on Windows)
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
         asyncio.run(run_server_mode())
     elif args.client:
         run_client_mode()
@@ -19,6 +19,7 @@ from network.protocol import (
     ChatMessage,
     CharacterUpdateMessage,
     MoveMessage,
+    PositionBatchMessage,
     PartyInviteMessage,
     PartyUpdateMessage,
     CombatActionMessage,
@@ -40,6 +41,7 @@ from network.master_server import (
     MasterServer,
     PlayerSession,
     SessionManager,
+    TokenPool,
 )
 
 from network.peer import (
@@ -62,6 +64,7 @@ __all__ = [
     "ChatMessage",
     "CharacterUpdateMessage",
     "MoveMessage",
+    "PositionBatchMessage",
     "PartyInviteMessage",
     "PartyUpdateMessage",
     "CombatActionMessage",
@@ -81,6 +84,7 @@ __all__ = [
     "MasterServer",
     "PlayerSession",
     "SessionManager",
+    "TokenPool",
     # P2P Client
     "NetworkClient",
     "NearbyPlayer",
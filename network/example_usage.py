@@ -407,6 +407,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Optional: libuv-based event loop (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
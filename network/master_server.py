@@ -5,17 +5,32 @@ REST API and WebSocket server for player authentication, character management,
 world state synchronization, and real-time updates.
 """
 import asyncio
+import base64
+import functools
+import hashlib
+import heapq
+import json
 import logging
-import secrets
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
 from contextlib import asynccontextmanager
 
 import aiohttp
 from aiohttp import web
-import aiohttp_cors
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
+try:
+    import orjson
+except ImportError:  # Optional: faster REST response encoding
+    orjson = None
+
 from config.settings import get_settings
 from database import get_db_session
 from database.models import (
@@ -23,14 +38,218 @@ from database.models import (
     FactionType, RealityType, ShardOwnership
 )
 from network.protocol import (
-    protocol, ProtocolError, MessageType,
-    AuthRequest, AuthResponse, ChatMessage, WorldStateMessage,
+    protocol, ProtocolError, MessageType, BaseMessage,
+    AuthRequest, AuthResponse, ChatMessage, MoveMessage, PositionBatchMessage,
+    WorldStateMessage,
     create_auth_response, create_world_state_message, create_shard_captured_message
 )
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Every connected WebSocket is subscribed to this channel
+GLOBAL_CHANNEL = "global"
+
+# Seconds of inactivity before a session expires
+SESSION_TIMEOUT = 3600
+
+# Longest wait between background sweeps of expired sessions
+SESSION_CLEANUP_INTERVAL = 30
+
+# Seconds between coalesced movement broadcasts
+MOVE_FLUSH_INTERVAL = 0.05
+
+# Distinct CORS preflight answers kept (origins are client-controlled, so bounded)
+PREFLIGHT_CACHE_SIZE = 256
+
+# Seconds between server pings; peers that miss the pong are closed
+WS_HEARTBEAT = 30.0
+
+# Largest WebSocket message accepted from a client
+WS_MAX_MESSAGE_SIZE = 64 * 1024
+
+# Threads running blocking database work for request handlers
+DB_WORKERS = 8
+
+# Seconds a serialized world state or shard response is reused
+WORLD_CACHE_TTL = 2.0
+
+# Records per chunk when streaming a JSON array
+STREAM_CHUNK_ROWS = 500
+
+
+def location_channel(location_id: int) -> str:
+    """Broadcast channel for players in a location."""
+    return f"location:{location_id}"
+
+
+def player_id_for(username: str) -> int:
+    """
+    Stable player ID for a username.
+
+    A 64-bit BLAKE2b digest masked to 53 bits: the same across restarts
+    (unlike the per-process salted hash()), collision-resistant, and still
+    exact as a JSON number in any client.
+    """
+    digest = hashlib.blake2b(username.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") & ((1 << 53) - 1)
+
+
+def _json_default(value):
+    """Encode datetimes and enums the way orjson does, for the stdlib fallback."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_stdlib_dumps = functools.partial(json.dumps, default=_json_default)
+
+
+def _json_dumps(data) -> bytes:
+    """
+    Encode data as JSON bytes, with orjson when it is installed.
+
+    Datetimes and enums may be passed as-is; both encoders write datetimes
+    in ISO 8601 and enums as their value.
+    """
+    if orjson is None:
+        return _stdlib_dumps(data).encode("utf-8")
+    return orjson.dumps(data)
+
+
+def _json_response(data, status: int = 200) -> web.Response:
+    """Build a JSON response from data."""
+    return web.Response(body=_json_dumps(data), status=status, content_type="application/json")
+
+
+async def _stream_json_array(response: web.StreamResponse, request: web.Request,
+                             key: str, rows) -> web.StreamResponse:
+    """
+    Stream {key: [rows...]} as JSON, one chunk per STREAM_CHUNK_ROWS records.
+
+    Only one chunk is held in memory at a time and the event loop gets a
+    turn between chunks. The first row is fetched before the response is
+    prepared, so query errors can still be answered with a normal error
+    response; check response.prepared before doing so.
+
+    Args:
+        response: Unprepared response to write to
+        request: Request being answered
+        key: Top-level key of the array
+        rows: Iterable of JSON-serializable records
+
+    Returns:
+        The finished response
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+
+    response.content_type = "application/json"
+    await response.prepare(request)
+
+    chunk = [b"{", _json_dumps(key), b":["]
+    if first is not None:
+        chunk.append(_json_dumps(first))
+        for count, row in enumerate(rows, 1):
+            chunk.append(b",")
+            chunk.append(_json_dumps(row))
+            if count % STREAM_CHUNK_ROWS == 0:
+                await response.write(b"".join(chunk))
+                chunk.clear()
+                await asyncio.sleep(0)
+    chunk.append(b"]}")
+    await response.write(b"".join(chunk))
+    await response.write_eof()
+    return response
+
+
+# Columns behind Character.to_dict(), selected directly to skip ORM hydration
+CHARACTER_COLUMNS = (
+    Character.id, Character.name, Character.is_player, Character.race,
+    Character.character_class, Character.faction,
+    Character.strength, Character.dexterity, Character.intelligence,
+    Character.constitution, Character.wisdom, Character.charisma,
+    Character.health, Character.max_health, Character.stamina,
+    Character.max_stamina, Character.mana, Character.max_mana,
+    Character.level, Character.experience, Character.souls,
+    Character.location_id, Character.created_at, Character.updated_at,
+)
+
+
+def _character_row_to_dict(row) -> Dict:
+    """Shape a CHARACTER_COLUMNS row like Character.to_dict()."""
+    return {
+        "id": row.id,
+        "name": row.name,
+        "is_player": row.is_player,
+        "race": row.race,
+        "class": row.character_class,
+        "faction": row.faction,
+        "stats": {
+            "strength": row.strength,
+            "dexterity": row.dexterity,
+            "intelligence": row.intelligence,
+            "constitution": row.constitution,
+            "wisdom": row.wisdom,
+            "charisma": row.charisma
+        },
+        "resources": {
+            "health": row.health,
+            "max_health": row.max_health,
+            "stamina": row.stamina,
+            "max_stamina": row.max_stamina,
+            "mana": row.mana,
+            "max_mana": row.max_mana
+        },
+        "progression": {
+            "level": row.level,
+            "experience": row.experience,
+            "souls": row.souls
+        },
+        "location_id": row.location_id,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at
+    }
+
+
+# Statements for the hot read endpoints, built once at import. The engine's
+# compiled cache (on by default) then supplies their SQL on every execute.
+_PLAYER_CHARACTERS_SELECT = select(*CHARACTER_COLUMNS).where(Character.is_player.is_(True))
+
+_FACTION_SHARD_COUNTS_SELECT = (
+    select(CrystalShard.owning_faction, func.count())
+    .where(CrystalShard.owning_faction.is_not(None))
+    .group_by(CrystalShard.owning_faction)
+)
+
+_SHARDS_SELECT = select(
+    CrystalShard.id,
+    CrystalShard.shard_number,
+    CrystalShard.shard_name.label("name"),
+    CrystalShard.description,
+    CrystalShard.location_id,
+    CrystalShard.is_captured,
+    CrystalShard.owning_faction,
+    CrystalShard.guardian_boss_name.label("guardian_name"),
+    CrystalShard.guardian_defeated,
+    CrystalShard.power_level
+)
+
+_RECENT_EVENTS_SELECT = (
+    select(
+        WorldEvent.id,
+        WorldEvent.event_type,
+        WorldEvent.title,
+        WorldEvent.description,
+        WorldEvent.timestamp,
+        WorldEvent.faction
+    )
+    .order_by(WorldEvent.timestamp.desc())
+    .limit(bindparam("limit"))
+)
+
 
 # ============================================================================
 # Session Management
@@ -39,95 +258,299 @@ settings = get_settings()
 class PlayerSession:
     """Represents an active player session."""
 
+    __slots__ = (
+        "session_token", "player_id", "username", "character_id",
+        "connected_at", "last_activity", "websocket", "channels", "location_id",
+    )
+
     def __init__(self, session_token: str, player_id: int, username: str,
                  character_id: Optional[int] = None):
         self.session_token = session_token
         self.player_id = player_id
         self.username = username
         self.character_id = character_id
-        self.connected_at = datetime.utcnow()
-        self.last_activity = datetime.utcnow()
+        self.connected_at = time.time()  # Wall clock, for logging only
+        self.last_activity = time.monotonic()
         self.websocket: Optional[web.WebSocketResponse] = None
+        # Broadcast channels beyond global, e.g. "faction:Shadowborn", "party:3"
+        self.channels: Set[str] = set()
+        # Last location reported by a MOVE; scopes movement broadcasts
+        self.location_id: Optional[int] = None
 
     def update_activity(self):
         """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self.last_activity = time.monotonic()
 
-    def is_expired(self, timeout_seconds: int = 3600) -> bool:
+    def is_expired(self, timeout_seconds: int = SESSION_TIMEOUT) -> bool:
         """Check if session has expired."""
-        elapsed = (datetime.utcnow() - self.last_activity).total_seconds()
-        return elapsed > timeout_seconds
+        return time.monotonic() - self.last_activity > timeout_seconds
+
+
+class TokenPool:
+    """
+    Issues URL-safe session tokens sliced from batched os.urandom reads.
+
+    Equivalent to secrets.token_urlsafe(token_bytes), but pays for one
+    urandom syscall per batch instead of one per login.
+    """
+
+    def __init__(self, token_bytes: int = 32, batch_size: int = 256):
+        self.token_bytes = token_bytes
+        self.batch_size = batch_size
+        self._buf = b""
+        self._pos = 0
+
+    def get(self) -> str:
+        """Return a fresh session token."""
+        end = self._pos + self.token_bytes
+        if end > len(self._buf):
+            self._buf = os.urandom(self.token_bytes * self.batch_size)
+            self._pos = 0
+            end = self.token_bytes
+        chunk = self._buf[self._pos:end]
+        self._pos = end
+        return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii")
 
 
 class SessionManager:
     """Manages active player sessions."""
 
     def __init__(self):
+        # Both indexes hold the same session objects; only _add_session and
+        # invalidate_session write to them, so they cannot drift apart
         self.sessions: Dict[str, PlayerSession] = {}
-        self.player_sessions: Dict[int, str] = {}  # player_id -> session_token
-        self.websockets: Set[web.WebSocketResponse] = set()
+        self.player_sessions: Dict[int, PlayerSession] = {}
+        # channel -> subscribed websockets; broadcasts only touch one channel
+        self.channel_subs: Dict[str, Set[web.WebSocketResponse]] = {GLOBAL_CHANNEL: set()}
+        self.websockets: Set[web.WebSocketResponse] = self.channel_subs[GLOBAL_CHANNEL]
+        # Websockets that speak binary frames rather than JSON text
+        self.binary_websockets: Set[web.WebSocketResponse] = set()
+        self.token_pool = TokenPool()
+        # (deadline, token) min-heap; entries may be stale, and are re-pushed
+        # or dropped when popped, so cleanup only visits due sessions
+        self._expiry_heap: List[Tuple[float, str]] = []
 
     def create_session(self, player_id: int, username: str,
                       character_id: Optional[int] = None) -> PlayerSession:
         """Create a new player session."""
         # Invalidate any existing session for this player
-        if player_id in self.player_sessions:
-            old_token = self.player_sessions[player_id]
-            self.sessions.pop(old_token, None)
+        old_session = self.player_sessions.get(player_id)
+        if old_session:
+            self.invalidate_session(old_session.session_token)
 
         # Generate secure session token
-        session_token = secrets.token_urlsafe(32)
+        session_token = self.token_pool.get()
 
+        # Usernames repeat across reconnects; share one string per name
+        username = sys.intern(username)
         session = PlayerSession(session_token, player_id, username, character_id)
-        self.sessions[session_token] = session
-        self.player_sessions[player_id] = session_token
+        self._add_session(session)
 
         logger.info(f"Created session for player {username} (ID: {player_id})")
         return session
 
-    def get_session(self, session_token: str) -> Optional[PlayerSession]:
-        """Get session by token."""
-        session = self.sessions.get(session_token)
+    def _add_session(self, session: PlayerSession):
+        """Index a session by token and by player ID."""
+        self.sessions[session.session_token] = session
+        self.player_sessions[session.player_id] = session
+        heapq.heappush(
+            self._expiry_heap,
+            (session.last_activity + SESSION_TIMEOUT, session.session_token)
+        )
+
+    def _touch(self, session: Optional[PlayerSession]) -> Optional[PlayerSession]:
+        """Refresh a live session's activity, or invalidate it if expired."""
         if session and not session.is_expired():
             session.update_activity()
             return session
         elif session:
             # Session expired
-            self.invalidate_session(session_token)
+            self.invalidate_session(session.session_token)
         return None
 
+    def get_session(self, session_token: str) -> Optional[PlayerSession]:
+        """Get session by token."""
+        return self._touch(self.sessions.get(session_token))
+
     def invalidate_session(self, session_token: str):
         """Invalidate a session."""
         session = self.sessions.pop(session_token, None)
         if session:
-            self.player_sessions.pop(session.player_id, None)
+            if self.player_sessions.get(session.player_id) is session:
+                del self.player_sessions[session.player_id]
             if session.websocket:
-                self.websockets.discard(session.websocket)
+                self.unsubscribe(session.websocket)
             logger.info(f"Invalidated session for player {session.username}")
 
+    def subscribe(self, ws: web.WebSocketResponse, channels):
+        """Subscribe a websocket to broadcast channels."""
+        for channel in channels:
+            self.channel_subs.setdefault(channel, set()).add(ws)
+
+    def unsubscribe(self, ws: web.WebSocketResponse, channels=None):
+        """Unsubscribe a websocket from the given channels, or from all of them."""
+        if channels is None:
+            channels = list(self.channel_subs)
+            self.binary_websockets.discard(ws)
+        for channel in channels:
+            subs = self.channel_subs.get(channel)
+            if subs is None:
+                continue
+            subs.discard(ws)
+            if not subs and channel != GLOBAL_CHANNEL:
+                del self.channel_subs[channel]
+
+    def set_session_channels(self, session: PlayerSession, channels: Set[str]):
+        """Replace a session's channels, moving its websocket subscriptions."""
+        if session.websocket:
+            self.unsubscribe(session.websocket, session.channels - channels)
+            self.subscribe(session.websocket, channels)
+        session.channels = set(channels)
+
+    def set_session_location(self, session: PlayerSession, location_id: int):
+        """Move a session's location channel subscription to a new location."""
+        if session.location_id == location_id:
+            return
+        channels = set(session.channels)
+        if session.location_id is not None:
+            channels.discard(location_channel(session.location_id))
+        channels.add(location_channel(location_id))
+        session.location_id = location_id
+        self.set_session_channels(session, channels)
+
+    async def broadcast(self, channel: str, message: BaseMessage) -> int:
+        """
+        Send a message to every websocket subscribed to a channel.
+
+        The message is serialized and UTF-8 encoded at most once per wire
+        format and sent to all subscribers concurrently. Text subscribers get
+        the pre-encoded payload through send_frame, so it is not re-encoded
+        per recipient the way send_str would.
+
+        Args:
+            channel: Channel name
+            message: Message to send
+
+        Returns:
+            Number of websockets the message was sent to
+        """
+        text = frame = None
+        sends = []
+        for ws in self.channel_subs.get(channel, ()):
+            if ws.closed:
+                continue
+            if ws in self.binary_websockets:
+                if frame is None:
+                    frame = protocol.encode(message)
+                sends.append(ws.send_bytes(frame))
+            else:
+                if text is None:
+                    text = protocol.serialize(message).encode("utf-8")
+                sends.append(ws.send_frame(text, aiohttp.WSMsgType.TEXT))
+
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting message: {result}")
+        return len(sends)
+
     def cleanup_expired_sessions(self):
-        """Remove all expired sessions."""
-        expired = [
-            token for token, session in self.sessions.items()
-            if session.is_expired()
-        ]
-        for token in expired:
-            self.invalidate_session(token)
+        """
+        Remove all expired sessions.
+
+        Pops only heap entries whose deadline has passed. A session that was
+        active since its entry was pushed goes back on with its new deadline;
+        entries for sessions already gone are dropped.
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] < now:
+            _, token = heapq.heappop(heap)
+            session = self.sessions.get(token)
+            if session is None:
+                continue
+            deadline = session.last_activity + SESSION_TIMEOUT
+            if deadline < now:
+                self.invalidate_session(token)
+                expired += 1
+            else:
+                heapq.heappush(heap, (deadline, token))
 
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+            logger.info(f"Cleaned up {expired} expired sessions")
+
+    def next_expiry(self) -> Optional[float]:
+        """Earliest monotonic time a session could expire, if any are tracked."""
+        return self._expiry_heap[0][0] if self._expiry_heap else None
 
     def get_active_player_count(self) -> int:
-        """Get count of active players."""
-        self.cleanup_expired_sessions()
+        """Get count of active players (expired sessions are swept in the background)."""
         return len(self.sessions)
 
     def get_session_by_player_id(self, player_id: int) -> Optional[PlayerSession]:
         """Get session by player ID."""
-        token = self.player_sessions.get(player_id)
-        if token:
-            return self.get_session(token)
-        return None
+        return self._touch(self.player_sessions.get(player_id))
+
+
+# ============================================================================
+# Movement Coalescing
+# ============================================================================
+
+class MoveAggregator:
+    """
+    Collects MoveMessages between ticks and emits one PositionBatchMessage
+    per broadcast channel.
+
+    Only the latest move per character is kept, so a player sending many
+    position updates within a tick costs one entry in the batch. Moves are
+    grouped by the channel of the mover's location, so only players in the
+    same location receive them. A move that changes location is also sent
+    to the old location's channel, so players there see the mover leave.
+    """
+
+    def __init__(self):
+        self.pending: Dict[int, Tuple[Set[str], MoveMessage]] = {}
+
+    def add(self, message: MoveMessage, *channels: str):
+        """
+        Record a move, replacing any earlier move by the same character.
+
+        A location change or position from an earlier move in the same tick
+        survives a later move that leaves that field unset.
+
+        Args:
+            message: The move to batch
+            *channels: Channels that receive it (global if none are given).
+                Channels of earlier moves in the same tick are kept.
+        """
+        targets = set(channels or (GLOBAL_CHANNEL,))
+        earlier = self.pending.get(message.character_id)
+        if earlier is not None:
+            earlier_channels, earlier_move = earlier
+            targets |= earlier_channels
+            if not message.to_location_id:
+                message.to_location_id = earlier_move.to_location_id
+            if message.position is None:
+                message.position = earlier_move.position
+        self.pending[message.character_id] = (targets, message)
+
+    def flush(self) -> Dict[str, PositionBatchMessage]:
+        """Build one batch per channel from pending moves and clear them."""
+        grouped: Dict[str, List[MoveMessage]] = {}
+        for channels, move in self.pending.values():
+            for channel in channels:
+                grouped.setdefault(channel, []).append(move)
+        self.pending.clear()
+
+        return {
+            channel: PositionBatchMessage(
+                character_ids=[move.character_id for move in moves],
+                location_ids=[move.to_location_id for move in moves],
+                positions=[move.position for move in moves],
+            )
+            for channel, moves in grouped.items()
+        }
 
 
 # ============================================================================
@@ -142,8 +565,16 @@ class MasterServer:
     def __init__(self, host: str = None, port: int = None):
         self.host = host or settings.master_server_host
         self.port = port or settings.master_server_port
-        self.app = web.Application()
+        self.app = web.Application(middlewares=[
+            self._preflight_cache_middleware,
+            self._session_middleware,
+        ])
+        self._preflight_cache: "OrderedDict[tuple, Dict[str, str]]" = OrderedDict()
+        self._world_cache: Dict[str, Tuple[float, bytes]] = {}
+        self._world_cache_lock = asyncio.Lock()
+        self._db_executor: Optional[ThreadPoolExecutor] = None
         self.session_manager = SessionManager()
+        self.move_aggregator = MoveAggregator()
         self.runner: Optional[web.AppRunner] = None
 
         # Setup routes
@@ -151,9 +582,13 @@ class MasterServer:
 
         # Background tasks
         self.cleanup_task: Optional[asyncio.Task] = None
+        self.move_flush_task: Optional[asyncio.Task] = None
 
     def _setup_routes(self):
         """Setup HTTP routes and WebSocket endpoints."""
+        # Only a running server needs CORS, not every importer of this module
+        import aiohttp_cors
+
         # REST API endpoints
         self.app.router.add_post("/api/auth/login", self.handle_login)
         self.app.router.add_post("/api/auth/register", self.handle_register)
@@ -191,6 +626,66 @@ class MasterServer:
         for route in list(self.app.router.routes()):
             cors.add(route)
 
+    @web.middleware
+    async def _preflight_cache_middleware(self, request: web.Request, handler):
+        """Answer repeated CORS preflights from cached aiohttp_cors headers."""
+        if request.method != "OPTIONS" or "Origin" not in request.headers:
+            return await handler(request)
+
+        key = (
+            request.match_info.route.resource,
+            request.headers["Origin"],
+            request.headers.get("Access-Control-Request-Method"),
+            request.headers.get("Access-Control-Request-Headers"),
+        )
+        headers = self._preflight_cache.get(key)
+        if headers is not None:
+            self._preflight_cache.move_to_end(key)
+            return web.Response(headers=headers)
+
+        response = await handler(request)
+        if response.status == 200:
+            self._preflight_cache[key] = {
+                name: value for name, value in response.headers.items()
+                if name.startswith("Access-Control-")
+            }
+            if len(self._preflight_cache) > PREFLIGHT_CACHE_SIZE:
+                self._preflight_cache.popitem(last=False)
+        return response
+
+    @web.middleware
+    async def _session_middleware(self, request: web.Request, handler):
+        """Resolve the bearer token once and store its session as request["session"]."""
+        authorization = request.headers.get("Authorization")
+        request["session"] = (
+            self.session_manager.get_session(authorization.removeprefix("Bearer "))
+            if authorization else None
+        )
+        return await handler(request)
+
+    async def _run_db(self, fn, *args):
+        """
+        Run blocking database work on the DB thread pool.
+
+        SQLAlchemy sessions here are synchronous, so handlers pass their
+        session-scoped work as a function and await its result instead of
+        blocking the event loop. The function must not touch websockets or
+        session channels; apply those changes after it returns.
+
+        Args:
+            fn: Function to run; opens and closes its own database session
+            *args: Arguments for fn
+
+        Returns:
+            The function's return value
+        """
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=DB_WORKERS, thread_name_prefix="master-db"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, functools.partial(fn, *args))
+
     # ========================================================================
     # Authentication Endpoints
     # ========================================================================
@@ -203,35 +698,33 @@ class MasterServer:
             password = data.get("password")
 
             if not username or not password:
-                return web.json_response(
+                return _json_response(
                     {"success": False, "message": "Username and password required"},
                     status=400
                 )
 
             # TODO: Implement actual password verification
-            # For now, we'll use a simple player lookup
-            with get_db_session() as session:
-                # In a real implementation, you'd have a Player/User table
-                # For now, we'll just create a simple session
-                player_id = hash(username) % 1000000  # Simple player ID generation
-
-                # Create session
-                player_session = self.session_manager.create_session(
-                    player_id=player_id,
-                    username=username
-                )
+            # In a real implementation, you'd look up a Player/User table
+            # (via self._run_db); for now, we'll just create a simple session
+            player_id = player_id_for(username)
+
+            # Create session
+            player_session = self.session_manager.create_session(
+                player_id=player_id,
+                username=username
+            )
 
-                return web.json_response({
-                    "success": True,
-                    "session_token": player_session.session_token,
-                    "player_id": player_id,
-                    "username": username,
-                    "message": "Login successful"
-                })
+            return _json_response({
+                "success": True,
+                "session_token": player_session.session_token,
+                "player_id": player_id,
+                "username": username,
+                "message": "Login successful"
+            })
 
         except Exception as e:
             logger.error(f"Login error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"success": False, "message": f"Login failed: {str(e)}"},
                 status=500
             )
@@ -244,21 +737,21 @@ class MasterServer:
             password = data.get("password")
 
             if not username or not password:
-                return web.json_response(
+                return _json_response(
                     {"success": False, "message": "Username and password required"},
                     status=400
                 )
 
             # TODO: Implement actual user registration with password hashing
             # For now, return success
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "message": "Registration successful. Please login."
             })
 
         except Exception as e:
             logger.error(f"Registration error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"success": False, "message": f"Registration failed: {str(e)}"},
                 status=500
             )
@@ -272,11 +765,11 @@ class MasterServer:
             if session_token:
                 self.session_manager.invalidate_session(session_token)
 
-            return web.json_response({"success": True, "message": "Logged out"})
+            return _json_response({"success": True, "message": "Logged out"})
 
         except Exception as e:
             logger.error(f"Logout error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"success": False, "message": f"Logout failed: {str(e)}"},
                 status=500
             )
@@ -287,324 +780,374 @@ class MasterServer:
 
     async def handle_get_characters(self, request: web.Request) -> web.Response:
         """Get list of characters for authenticated player."""
-        session_token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        session = self.session_manager.get_session(session_token)
+        session = request["session"]
 
         if not session:
-            return web.json_response(
+            return _json_response(
                 {"error": "Unauthorized"},
                 status=401
             )
 
         try:
-            with get_db_session() as db_session:
-                # In a real implementation, filter by player_id
-                # For now, return all player characters
-                characters = db_session.query(Character).filter(
-                    Character.is_player == True
-                ).all()
-
-                return web.json_response({
-                    "characters": [char.to_dict() for char in characters]
-                })
+            characters = await self._run_db(self._load_player_characters)
+            return _json_response({"characters": characters})
 
         except Exception as e:
             logger.error(f"Get characters error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to get characters: {str(e)}"},
                 status=500
             )
 
+    def _load_player_characters(self) -> List[Dict]:
+        """Read player characters from the database."""
+        with get_db_session() as db_session:
+            # In a real implementation, filter by player_id
+            # For now, return all player characters
+            rows = db_session.execute(_PLAYER_CHARACTERS_SELECT)
+            return [_character_row_to_dict(row) for row in rows]
+
     async def handle_create_character(self, request: web.Request) -> web.Response:
         """Create a new character."""
-        session_token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        session = self.session_manager.get_session(session_token)
+        session = request["session"]
 
         if not session:
-            return web.json_response({"error": "Unauthorized"}, status=401)
+            return _json_response({"error": "Unauthorized"}, status=401)
 
         try:
             data = await request.json()
 
             # TODO: Use CharacterCreator from characters.character module
             # For now, return success message
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "message": "Character creation endpoint - implement with CharacterCreator"
             })
 
         except Exception as e:
             logger.error(f"Create character error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to create character: {str(e)}"},
                 status=500
             )
 
     async def handle_select_character(self, request: web.Request) -> web.Response:
         """Select a character for the current session."""
-        session_token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        session = self.session_manager.get_session(session_token)
+        session = request["session"]
 
         if not session:
-            return web.json_response({"error": "Unauthorized"}, status=401)
+            return _json_response({"error": "Unauthorized"}, status=401)
 
         try:
             data = await request.json()
             character_id = data.get("character_id")
 
             if not character_id:
-                return web.json_response(
+                return _json_response(
                     {"error": "character_id required"},
                     status=400
                 )
 
-            with get_db_session() as db_session:
-                character = db_session.query(Character).filter(
-                    Character.id == character_id
-                ).first()
-
-                if not character:
-                    return web.json_response(
-                        {"error": "Character not found"},
-                        status=404
-                    )
+            loaded = await self._run_db(self._load_character_channels, character_id)
+            if loaded is None:
+                return _json_response(
+                    {"error": "Character not found"},
+                    status=404
+                )
+            character, channels = loaded
 
-                # Update session
-                session.character_id = character_id
+            # Update session and its broadcast channels
+            session.character_id = character_id
+            if session.location_id is not None:
+                channels.add(location_channel(session.location_id))
+            self.session_manager.set_session_channels(session, channels)
 
-                return web.json_response({
-                    "success": True,
-                    "character": character.to_dict()
-                })
+            return _json_response({
+                "success": True,
+                "character": character
+            })
 
         except Exception as e:
             logger.error(f"Select character error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to select character: {str(e)}"},
                 status=500
             )
 
+    def _load_character_channels(self, character_id: int) -> Optional[Tuple[Dict, Set[str]]]:
+        """Read a character and its faction and party channels, or None if missing."""
+        with get_db_session() as db_session:
+            character = db_session.query(Character).filter(
+                Character.id == character_id
+            ).first()
+
+            if not character:
+                return None
+
+            channels = {f"faction:{character.faction.value}"}
+            channels.update(
+                f"party:{party.id}" for party in character.parties if party.is_active
+            )
+            return character.to_dict(), channels
+
     async def handle_delete_character(self, request: web.Request) -> web.Response:
         """Delete a character."""
-        session_token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        session = self.session_manager.get_session(session_token)
+        session = request["session"]
 
         if not session:
-            return web.json_response({"error": "Unauthorized"}, status=401)
+            return _json_response({"error": "Unauthorized"}, status=401)
 
         try:
             character_id = int(request.match_info["character_id"])
 
-            with get_db_session() as db_session:
-                character = db_session.query(Character).filter(
-                    Character.id == character_id
-                ).first()
-
-                if not character:
-                    return web.json_response(
-                        {"error": "Character not found"},
-                        status=404
-                    )
-
-                db_session.delete(character)
-                db_session.commit()
+            name = await self._run_db(self._delete_character, character_id)
+            if name is None:
+                return _json_response(
+                    {"error": "Character not found"},
+                    status=404
+                )
 
-                return web.json_response({
-                    "success": True,
-                    "message": f"Character {character.name} deleted"
-                })
+            return _json_response({
+                "success": True,
+                "message": f"Character {name} deleted"
+            })
 
         except Exception as e:
             logger.error(f"Delete character error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to delete character: {str(e)}"},
                 status=500
             )
 
+    def _delete_character(self, character_id: int) -> Optional[str]:
+        """Delete a character, returning its name, or None if missing."""
+        with get_db_session() as db_session:
+            character = db_session.query(Character).filter(
+                Character.id == character_id
+            ).first()
+
+            if not character:
+                return None
+
+            name = character.name
+            db_session.delete(character)
+            db_session.commit()
+            return name
+
     # ========================================================================
     # World State Endpoints
     # ========================================================================
 
+    def invalidate_world_cache(self):
+        """
+        Drop cached world state and shard responses.
+
+        Call after changing WorldState or CrystalShard rows so the next
+        request reads them fresh instead of waiting out WORLD_CACHE_TTL.
+        """
+        self._world_cache.clear()
+
+    async def _cached_json_response(self, key: str, build) -> web.Response:
+        """
+        Serve a JSON response from the world cache, rebuilding it when stale.
+
+        The encoded body is cached rather than the data, so hits skip both
+        the database and serialization. The lock makes concurrent requests
+        for a stale entry share a single rebuild, which runs on the DB pool.
+
+        Args:
+            key: Cache key for the response
+            build: Blocking callable returning the response data
+
+        Returns:
+            JSON response
+        """
+        entry = self._world_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= WORLD_CACHE_TTL:
+            async with self._world_cache_lock:
+                entry = self._world_cache.get(key)
+                if entry is None or time.monotonic() - entry[0] >= WORLD_CACHE_TTL:
+                    data = await self._run_db(build)
+                    entry = (time.monotonic(), _json_dumps(data))
+                    self._world_cache[key] = entry
+
+        return web.Response(body=entry[1], content_type="application/json")
+
     async def handle_get_world_state(self, request: web.Request) -> web.Response:
         """Get current world state."""
         try:
-            with get_db_session() as db_session:
-                world_state = db_session.query(WorldState).first()
-
-                if not world_state:
-                    # Create default world state
-                    world_state = WorldState(
-                        current_reality=RealityType.NEUTRAL,
-                        reality_stability=100.0,
-                        aetherfall_count=0,
-                        total_aetherfalls=0,
-                        active_players=self.session_manager.get_active_player_count()
-                    )
-                    db_session.add(world_state)
-                    db_session.commit()
-
-                # Get shard distribution
-                shards = db_session.query(CrystalShard).all()
-                faction_counts = {}
-                for shard in shards:
-                    if shard.owning_faction:
-                        faction = shard.owning_faction.value
-                        faction_counts[faction] = faction_counts.get(faction, 0) + 1
-
-                return web.json_response({
-                    "current_reality": world_state.current_reality.value,
-                    "reality_stability": world_state.reality_stability,
-                    "faction_shard_counts": faction_counts,
-                    "dominant_faction": world_state.dominant_faction.value if world_state.dominant_faction else None,
-                    "active_players": self.session_manager.get_active_player_count(),
-                    "total_aetherfalls": world_state.total_aetherfalls,
-                    "aetherfall_count": world_state.aetherfall_count
-                })
-
+            return await self._cached_json_response("world_state", self._build_world_state)
         except Exception as e:
             logger.error(f"Get world state error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to get world state: {str(e)}"},
                 status=500
             )
 
+    def _build_world_state(self) -> Dict:
+        """Read the world state and shard distribution from the database."""
+        with get_db_session() as db_session:
+            world_state = db_session.query(WorldState).first()
+
+            if not world_state:
+                # Create default world state
+                world_state = WorldState(
+                    current_reality=RealityType.NEUTRAL,
+                    reality_stability=100.0,
+                    aetherfall_count=0,
+                    total_aetherfalls=0,
+                    active_players=self.session_manager.get_active_player_count()
+                )
+                db_session.add(world_state)
+                db_session.commit()
+
+            # Get shard distribution
+            rows = db_session.execute(_FACTION_SHARD_COUNTS_SELECT)
+            faction_counts = {faction.value: count for faction, count in rows}
+
+            return {
+                "current_reality": world_state.current_reality.value,
+                "reality_stability": world_state.reality_stability,
+                "faction_shard_counts": faction_counts,
+                "dominant_faction": world_state.dominant_faction.value if world_state.dominant_faction else None,
+                "active_players": self.session_manager.get_active_player_count(),
+                "total_aetherfalls": world_state.total_aetherfalls,
+                "aetherfall_count": world_state.aetherfall_count
+            }
+
     async def handle_get_shards(self, request: web.Request) -> web.Response:
         """Get information about all Crystal Shards."""
         try:
-            with get_db_session() as db_session:
-                shards = db_session.query(CrystalShard).all()
-
-                shard_data = []
-                for shard in shards:
-                    shard_data.append({
-                        "id": shard.id,
-                        "shard_number": shard.shard_number,
-                        "name": shard.shard_name,
-                        "description": shard.description,
-                        "location_id": shard.location_id,
-                        "is_captured": shard.is_captured,
-                        "owning_faction": shard.owning_faction.value if shard.owning_faction else None,
-                        "guardian_name": shard.guardian_boss_name,
-                        "guardian_defeated": shard.guardian_defeated,
-                        "power_level": shard.power_level
-                    })
-
-                return web.json_response({"shards": shard_data})
-
+            return await self._cached_json_response("shards", self._build_shards)
         except Exception as e:
             logger.error(f"Get shards error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to get shards: {str(e)}"},
                 status=500
             )
 
+    def _build_shards(self) -> Dict:
+        """Read all Crystal Shards from the database."""
+        with get_db_session() as db_session:
+            rows = db_session.execute(_SHARDS_SELECT)
+
+            return {"shards": [dict(row) for row in rows.mappings()]}
+
     async def handle_get_events(self, request: web.Request) -> web.Response:
-        """Get recent world events."""
+        """Get recent world events, streamed since the limit is client-chosen."""
+        response = web.StreamResponse()
         try:
             limit = int(request.query.get("limit", "50"))
-
-            with get_db_session() as db_session:
-                events = db_session.query(WorldEvent).order_by(
-                    WorldEvent.timestamp.desc()
-                ).limit(limit).all()
-
-                event_data = []
-                for event in events:
-                    event_data.append({
-                        "id": event.id,
-                        "event_type": event.event_type,
-                        "title": event.title,
-                        "description": event.description,
-                        "timestamp": event.timestamp.isoformat(),
-                        "faction": event.faction.value if event.faction else None
-                    })
-
-                return web.json_response({"events": event_data})
+            event_data = await self._run_db(self._load_recent_events, limit)
+            return await _stream_json_array(response, request, "events", event_data)
 
         except Exception as e:
             logger.error(f"Get events error: {e}")
-            return web.json_response(
+            if response.prepared:
+                # Headers are already sent; let aiohttp drop the connection
+                raise
+            return _json_response(
                 {"error": f"Failed to get events: {str(e)}"},
                 status=500
             )
 
+    def _load_recent_events(self, limit: int) -> List[Dict]:
+        """Read the most recent world events from the database."""
+        with get_db_session() as db_session:
+            rows = db_session.execute(_RECENT_EVENTS_SELECT, {"limit": limit})
+            return [dict(row) for row in rows.mappings()]
+
     # ========================================================================
     # Party Management Endpoints
     # ========================================================================
 
     async def handle_get_party(self, request: web.Request) -> web.Response:
         """Get party information."""
-        session_token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        session = self.session_manager.get_session(session_token)
+        session = request["session"]
 
         if not session:
-            return web.json_response({"error": "Unauthorized"}, status=401)
+            return _json_response({"error": "Unauthorized"}, status=401)
 
         try:
             party_id = int(request.match_info["party_id"])
 
-            with get_db_session() as db_session:
-                party = db_session.query(Party).filter(Party.id == party_id).first()
-
-                if not party:
-                    return web.json_response({"error": "Party not found"}, status=404)
+            party = await self._run_db(self._load_party, party_id)
+            if party is None:
+                return _json_response({"error": "Party not found"}, status=404)
 
-                return web.json_response({
-                    "id": party.id,
-                    "party_name": party.party_name,
-                    "leader_id": party.leader_id,
-                    "is_active": party.is_active,
-                    "max_members": party.max_members,
-                    "member_count": len(party.members),
-                    "loot_sharing": party.loot_sharing
-                })
+            return _json_response(party)
 
         except Exception as e:
             logger.error(f"Get party error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to get party: {str(e)}"},
                 status=500
             )
 
+    def _load_party(self, party_id: int) -> Optional[Dict]:
+        """Read a party's summary, or None if missing."""
+        with get_db_session() as db_session:
+            party = db_session.query(Party).filter(Party.id == party_id).first()
+
+            if not party:
+                return None
+
+            return {
+                "id": party.id,
+                "party_name": party.party_name,
+                "leader_id": party.leader_id,
+                "is_active": party.is_active,
+                "max_members": party.max_members,
+                "member_count": len(party.members),
+                "loot_sharing": party.loot_sharing
+            }
+
     async def handle_create_party(self, request: web.Request) -> web.Response:
         """Create a new party."""
-        session_token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        session = self.session_manager.get_session(session_token)
+        session = request["session"]
 
         if not session or not session.character_id:
-            return web.json_response({"error": "Unauthorized"}, status=401)
+            return _json_response({"error": "Unauthorized"}, status=401)
 
         try:
             data = await request.json()
             party_name = data.get("party_name", "Adventuring Party")
 
-            with get_db_session() as db_session:
-                party = Party(
-                    party_name=party_name,
-                    leader_id=session.character_id,
-                    is_active=True
-                )
-                db_session.add(party)
-                db_session.commit()
-                db_session.refresh(party)
+            party_id = await self._run_db(self._create_party, party_name, session.character_id)
 
-                return web.json_response({
-                    "success": True,
-                    "party_id": party.id,
-                    "party_name": party.party_name
-                })
+            self.session_manager.set_session_channels(
+                session, session.channels | {f"party:{party_id}"}
+            )
+
+            return _json_response({
+                "success": True,
+                "party_id": party_id,
+                "party_name": party_name
+            })
 
         except Exception as e:
             logger.error(f"Create party error: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": f"Failed to create party: {str(e)}"},
                 status=500
             )
 
+    def _create_party(self, party_name: str, leader_id: int) -> int:
+        """Create an active party and return its id."""
+        with get_db_session() as db_session:
+            party = Party(
+                party_name=party_name,
+                leader_id=leader_id,
+                is_active=True
+            )
+            db_session.add(party)
+            db_session.commit()
+            return party.id
+
     async def handle_party_invite(self, request: web.Request) -> web.Response:
         """Invite a player to party."""
         # TODO: Implement party invitation logic
-        return web.json_response({
+        return _json_response({
             "success": False,
             "message": "Party invite endpoint - to be implemented"
         })
@@ -612,7 +1155,7 @@ class MasterServer:
     async def handle_party_leave(self, request: web.Request) -> web.Response:
         """Leave current party."""
         # TODO: Implement party leave logic
-        return web.json_response({
+        return _json_response({
             "success": False,
             "message": "Party leave endpoint - to be implemented"
         })
@@ -623,7 +1166,7 @@ class MasterServer:
 
     async def handle_status(self, request: web.Request) -> web.Response:
         """Server status endpoint."""
-        return web.json_response({
+        return _json_response({
             "status": "online",
             "version": "1.0.0",
             "active_players": self.session_manager.get_active_player_count(),
@@ -638,7 +1181,13 @@ class MasterServer:
 
     async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
         """Handle WebSocket connections for real-time updates."""
-        ws = web.WebSocketResponse()
+        # Heartbeats let aiohttp reap dead peers; compression stays off since
+        # frames are small and each broadcast would be deflated per recipient
+        ws = web.WebSocketResponse(
+            heartbeat=WS_HEARTBEAT,
+            max_msg_size=WS_MAX_MESSAGE_SIZE,
+            compress=False
+        )
         await ws.prepare(request)
 
         session_token = None
@@ -649,69 +1198,104 @@ class MasterServer:
 
         try:
             async for msg in ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    try:
-                        # Deserialize message
-                        message = protocol.deserialize(msg.data)
-
-                        # Handle authentication
-                        if message.type == MessageType.AUTH_REQUEST:
-                            auth_msg: AuthRequest = message
-                            # Verify session token or credentials
-                            if auth_msg.session_token:
-                                player_session = self.session_manager.get_session(
-                                    auth_msg.session_token
-                                )
-                                if player_session:
-                                    player_session.websocket = ws
-                                    session_token = auth_msg.session_token
-                                    response = create_auth_response(
-                                        success=True,
-                                        session_token=session_token,
-                                        player_id=player_session.player_id,
-                                        message="WebSocket authenticated"
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    # Reply in the framing the client used
+                    binary = msg.type == aiohttp.WSMsgType.BINARY
+                    if binary:
+                        self.session_manager.binary_websockets.add(ws)
+
+                    async def reply(response: BaseMessage):
+                        # Echo the request's id so clients can match replies
+                        response.message_id = request_id
+                        if binary:
+                            await ws.send_bytes(protocol.encode(response))
+                        else:
+                            await ws.send_str(protocol.serialize(response))
+
+                    # Clients may batch several binary frames into one message
+                    payloads = [msg.data]
+                    if binary:
+                        try:
+                            payloads = protocol.split_frames(msg.data)
+                        except ProtocolError as e:
+                            logger.error(f"Protocol error: {e}")
+                            payloads = []
+
+                    for payload in payloads:
+                        request_id = None
+                        try:
+                            # Deserialize message
+                            if binary:
+                                message = protocol.decode(payload)
+                            else:
+                                message = protocol.deserialize(payload)
+                            request_id = message.message_id
+
+                            # Handle authentication
+                            if message.type == MessageType.AUTH_REQUEST:
+                                auth_msg: AuthRequest = message
+                                # Verify session token or credentials
+                                if auth_msg.session_token:
+                                    player_session = self.session_manager.get_session(
+                                        auth_msg.session_token
                                     )
+                                    if player_session:
+                                        player_session.websocket = ws
+                                        self.session_manager.subscribe(ws, player_session.channels)
+                                        session_token = auth_msg.session_token
+                                        response = create_auth_response(
+                                            success=True,
+                                            session_token=session_token,
+                                            player_id=player_session.player_id,
+                                            message="WebSocket authenticated"
+                                        )
+                                    else:
+                                        response = create_auth_response(
+                                            success=False,
+                                            message="Invalid session token"
+                                        )
                                 else:
                                     response = create_auth_response(
                                         success=False,
-                                        message="Invalid session token"
+                                        message="Session token required"
                                     )
-                            else:
-                                response = create_auth_response(
-                                    success=False,
-                                    message="Session token required"
-                                )
 
-                            await ws.send_str(protocol.serialize(response))
+                                await reply(response)
 
-                        # Handle chat messages
-                        elif message.type in [MessageType.CHAT, MessageType.PARTY_CHAT,
-                                             MessageType.FACTION_CHAT]:
-                            if player_session:
-                                # Broadcast to appropriate channels
-                                await self._broadcast_message(message, player_session)
-
-                        # Handle ping/pong
-                        elif message.type == MessageType.PING:
-                            pong = protocol.serialize(BaseMessage(type=MessageType.PONG))
-                            await ws.send_str(pong)
-
-                    except ProtocolError as e:
-                        logger.error(f"Protocol error: {e}")
-                        error = protocol.create_error_message(
-                            "PROTOCOL_ERROR",
-                            str(e)
-                        )
-                        await ws.send_str(protocol.serialize(error))
+                            # Handle chat messages
+                            elif message.type in [MessageType.CHAT, MessageType.PARTY_CHAT,
+                                                 MessageType.FACTION_CHAT]:
+                                if player_session:
+                                    # Broadcast to appropriate channels
+                                    await self._broadcast_message(message, player_session)
+
+                            # Movement is coalesced and broadcast once per tick
+                            elif message.type == MessageType.MOVE:
+                                if player_session:
+                                    self._queue_move(message, player_session)
+
+                            # Handle ping/pong
+                            elif message.type == MessageType.PING:
+                                await reply(BaseMessage(type=MessageType.PONG))
+
+                        except ProtocolError as e:
+                            logger.error(f"Protocol error: {e}")
+                            error = protocol.create_error_message(
+                                "PROTOCOL_ERROR",
+                                str(e)
+                            )
+                            await reply(error)
 
                 elif msg.type == aiohttp.WSMsgType.ERROR:
+                    # Includes oversized messages; the connection is closing
                     logger.error(f"WebSocket error: {ws.exception()}")
+                    break
 
         except Exception as e:
             logger.error(f"WebSocket handler error: {e}")
 
         finally:
-            self.session_manager.websockets.discard(ws)
+            self.session_manager.unsubscribe(ws)
             if player_session and player_session.websocket == ws:
                 player_session.websocket = None
             logger.info("WebSocket connection closed")
@@ -720,27 +1304,36 @@ class MasterServer:
 
     async def _broadcast_message(self, message: ChatMessage, sender_session: PlayerSession):
         """Broadcast a message to appropriate recipients."""
-        serialized = protocol.serialize(message)
-
-        # Determine recipients based on channel
-        recipients = []
-        if message.channel == "global":
-            # Broadcast to all connected websockets
-            recipients = list(self.session_manager.websockets)
-        elif message.channel == "party":
-            # TODO: Get party members' websockets
-            pass
-        elif message.channel == "faction":
-            # TODO: Get faction members' websockets
-            pass
-
-        # Send to all recipients
-        for ws in recipients:
-            try:
-                if not ws.closed:
-                    await ws.send_str(serialized)
-            except Exception as e:
-                logger.error(f"Error broadcasting message: {e}")
+        # Determine the channel: global, or the sender's party/faction channel
+        if message.channel == GLOBAL_CHANNEL:
+            channel = GLOBAL_CHANNEL
+        else:
+            prefix = f"{message.channel}:"
+            channel = next(
+                (c for c in sender_session.channels if c.startswith(prefix)), None
+            )
+            if channel is None:
+                return
+
+        await self.session_manager.broadcast(channel, message)
+
+    def _queue_move(self, message: MoveMessage, sender_session: PlayerSession):
+        """Queue a move for the next position batch on the sender's location channels."""
+        # Only the session's own character may move; a client-supplied id is ignored
+        if sender_session.character_id is None:
+            return
+        message.character_id = sender_session.character_id
+
+        channels = []
+        previous_location_id = sender_session.location_id
+        if message.to_location_id and message.to_location_id != previous_location_id:
+            self.session_manager.set_session_location(sender_session, message.to_location_id)
+            if previous_location_id is not None:
+                # Players left behind must see the mover's new location
+                channels.append(location_channel(previous_location_id))
+        if sender_session.location_id is not None:
+            channels.append(location_channel(sender_session.location_id))
+        self.move_aggregator.add(message, *channels)
 
     # ========================================================================
     # Server Lifecycle
@@ -750,8 +1343,9 @@ class MasterServer:
         """Start the master server."""
         logger.info(f"Starting master server on {self.host}:{self.port}")
 
-        # Start cleanup task
+        # Start background tasks
         self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self.move_flush_task = asyncio.create_task(self._move_flush_loop())
 
         # Start web server
         self.runner = web.AppRunner(self.app)
@@ -765,9 +1359,11 @@ class MasterServer:
         """Stop the master server."""
         logger.info("Stopping master server...")
 
-        # Cancel cleanup task
+        # Cancel background tasks
         if self.cleanup_task:
             self.cleanup_task.cancel()
+        if self.move_flush_task:
+            self.move_flush_task.cancel()
 
         # Close all websockets
         for ws in list(self.session_manager.websockets):
@@ -777,13 +1373,22 @@ class MasterServer:
         if self.runner:
             await self.runner.cleanup()
 
+        if self._db_executor:
+            self._db_executor.shutdown(wait=False)
+            self._db_executor = None
+
         logger.info("Master server stopped")
 
     async def _cleanup_loop(self):
         """Background task to cleanup expired sessions."""
         while True:
             try:
-                await asyncio.sleep(300)  # Run every 5 minutes
+                # Wake at the next deadline, but at least every interval
+                delay = SESSION_CLEANUP_INTERVAL
+                next_expiry = self.session_manager.next_expiry()
+                if next_expiry is not None:
+                    delay = min(delay, max(next_expiry - time.monotonic(), 0.0))
+                await asyncio.sleep(delay)
                 self.session_manager.cleanup_expired_sessions()
             except asyncio.CancelledError:
                 break
@@ -791,6 +1396,20 @@ class MasterServer:
                 logger.error(f"Cleanup loop error: {e}")
 
 
+    async def _move_flush_loop(self):
+        """Background task to broadcast coalesced movement every tick."""
+        while True:
+            try:
+                await asyncio.sleep(MOVE_FLUSH_INTERVAL)
+                batches = self.move_aggregator.flush()
+                for channel, batch in batches.items():
+                    await self.session_manager.broadcast(channel, batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Move flush loop error: {e}")
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -814,4 +1433,12 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+
+    # Optional: libuv-based event loop (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -10,24 +10,25 @@ Handles client-side networking including:
 - Optional encryption
 """
 import asyncio
+import functools
+import itertools
 import logging
 import json
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
-from datetime import datetime
+import os
+import time
+from typing import Dict, List, Optional, Callable, Any, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 import aiohttp
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
 import base64
 
 from config.settings import get_settings
 from network.protocol import (
-    protocol, ProtocolError, MessageType, BaseMessage,
+    protocol, ProtocolError, MessageType, BaseMessage, MESSAGE_TYPE_CODES, FRAME_FLAG_BATCH,
     AuthRequest, AuthResponse, ChatMessage, MoveMessage,
     CharacterUpdateMessage, PartyInviteMessage, CombatActionMessage,
+    PositionBatchMessage,
     create_auth_request, create_chat_message, create_move_message,
     create_character_update
 )
@@ -35,49 +36,100 @@ from network.protocol import (
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Seconds outbound binary frames wait to be coalesced into one WebSocket message
+OUTBOUND_FLUSH_DELAY = 0.01
+
+# Bytes of random nonce prepended to each encrypted message
+NONCE_SIZE = 12
+
+# Seconds an idle connection to the master server is kept open for reuse
+HTTP_KEEPALIVE_TIMEOUT = 75
+
+# Smallest per-axis position change worth sending to the server
+POSITION_DEADBAND = 0.01
+
+# Minimum seconds between position updates sent (caps them at 20 Hz)
+POSITION_SEND_INTERVAL = 0.05
+
+# Connection pool shared by every NetworkClient on the running event loop
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_shared_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the shared connector, creating it for the running loop if needed."""
+    global _shared_connector, _shared_connector_loop
+    loop = asyncio.get_running_loop()
+    if _shared_connector is None or _shared_connector.closed or _shared_connector_loop is not loop:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=100,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300
+        )
+        _shared_connector_loop = loop
+    return _shared_connector
+
 
 # ============================================================================
 # Encryption Support
 # ============================================================================
 
+@functools.lru_cache(maxsize=4)
+def _derive_key(password: str) -> bytes:
+    """
+    Derive a 256-bit key from a password.
+
+    PBKDF2 is deliberately slow, and the password normally comes from
+    settings, so derived keys are cached for the life of the process.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b'shards_of_eternity_salt',  # In production, use random salt
+        iterations=100000
+    )
+    return kdf.derive(password.encode())
+
+
 class EncryptionHandler:
-    """Handles message encryption/decryption for P2P communication."""
+    """
+    Handles message encryption/decryption for P2P communication.
+
+    Messages are sealed with AES-256-GCM, a single-pass AEAD that OpenSSL
+    runs on AES-NI/PCLMULQDQ (or ARMv8 crypto extensions). The random nonce
+    is prepended to the ciphertext and the result is base64url encoded once,
+    so it still travels in a text WebSocket frame.
+    """
 
     def __init__(self, encryption_key: Optional[str] = None):
         """
         Initialize encryption handler.
 
         Args:
-            encryption_key: Encryption key. If None, generates a new key.
+            encryption_key: Password to derive the key from. If None, uses
+                the configured encryption key or generates a new key.
         """
-        if encryption_key:
-            self.key = encryption_key.encode()
+        # Imported here so importing the networking package doesn't load
+        # cryptography's OpenSSL bindings unless encryption is used
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        password = encryption_key or settings.encryption_key
+        if password:
+            self.key = _derive_key(password)
         else:
-            # Generate key from settings or create new
-            if settings.encryption_key:
-                self.key = self._derive_key(settings.encryption_key)
-            else:
-                self.key = Fernet.generate_key()
-
-        self.cipher = Fernet(self.key)
-
-    def _derive_key(self, password: str) -> bytes:
-        """Derive encryption key from password."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'shards_of_eternity_salt',  # In production, use random salt
-            iterations=100000,
-            backend=default_backend()
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+            self.key = AESGCM.generate_key(bit_length=256)
+
+        self.cipher = AESGCM(self.key)
 
     def encrypt(self, message: str) -> str:
         """Encrypt a message."""
         try:
-            encrypted = self.cipher.encrypt(message.encode())
-            return base64.b64encode(encrypted).decode()
+            nonce = os.urandom(NONCE_SIZE)
+            sealed = self.cipher.encrypt(nonce, message.encode(), None)
+            return base64.urlsafe_b64encode(nonce + sealed).decode("ascii")
         except Exception as e:
             logger.error(f"Encryption error: {e}")
             raise
@@ -85,8 +137,8 @@ class EncryptionHandler:
     def decrypt(self, encrypted_message: str) -> str:
         """Decrypt a message."""
         try:
-            encrypted_bytes = base64.b64decode(encrypted_message.encode())
-            decrypted = self.cipher.decrypt(encrypted_bytes)
+            data = base64.urlsafe_b64decode(encrypted_message)
+            decrypted = self.cipher.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], None)
             return decrypted.decode()
         except Exception as e:
             logger.error(f"Decryption error: {e}")
@@ -97,7 +149,7 @@ class EncryptionHandler:
 # Nearby Player
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NearbyPlayer:
     """Represents a nearby player for P2P communication."""
     player_id: int
@@ -105,18 +157,20 @@ class NearbyPlayer:
     character_name: str
     location_id: int
     position: Optional[Dict[str, float]] = None
-    last_seen: datetime = None
     faction: Optional[str] = None
     level: Optional[int] = None
+    # Monotonic clock reading; cheap enough to take on every position update
+    last_seen_monotonic: float = field(default_factory=time.monotonic)
 
-    def __post_init__(self):
-        if self.last_seen is None:
-            self.last_seen = datetime.utcnow()
+    @property
+    def last_seen(self) -> datetime:
+        """UTC wall-clock time the player was last seen, derived on demand."""
+        return datetime.utcnow() - timedelta(seconds=time.monotonic() - self.last_seen_monotonic)
 
     def update_position(self, position: Dict[str, float]):
         """Update player position."""
         self.position = position
-        self.last_seen = datetime.utcnow()
+        self.last_seen_monotonic = time.monotonic()
 
 
 # ============================================================================
@@ -130,12 +184,16 @@ class NetworkClient:
     Handles connections to master server and P2P communication with other players.
     """
 
-    def __init__(self, master_server_url: Optional[str] = None):
+    def __init__(self, master_server_url: Optional[str] = None,
+                 http_session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize network client.
 
         Args:
             master_server_url: Master server URL. Defaults to settings.
+            http_session: HTTP session to use. The caller keeps ownership and
+                must close it. Defaults to a per-connection session on the
+                shared connection pool.
         """
         self.master_server_url = master_server_url or settings.master_server_url
         self.session_token: Optional[str] = None
@@ -144,7 +202,8 @@ class NetworkClient:
         self.username: Optional[str] = None
 
         # HTTP session for REST API calls
-        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.http_session: Optional[aiohttp.ClientSession] = http_session
+        self._owns_http_session = http_session is None
 
         # WebSocket for real-time updates
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
@@ -160,7 +219,28 @@ class NetworkClient:
             self.encryption_handler = EncryptionHandler()
 
         # Message handlers
-        self.message_handlers: Dict[MessageType, List[Callable]] = {}
+        # Each handler is stored with whether it is a coroutine function,
+        # so dispatch doesn't re-inspect it for every message
+        self.message_handlers: Dict[MessageType, List[Tuple[Callable, bool]]] = {}
+        # Binary-frame type codes worth decoding, indexed by header byte
+        self._wanted_codes = bytearray(len(MESSAGE_TYPE_CODES))
+        for message_type in (MessageType.CHARACTER_UPDATE, MessageType.POSITION_BATCH):
+            self._wanted_codes[MESSAGE_TYPE_CODES[message_type.value]] = 1
+
+        # Outbound binary frames waiting to be sent as one batch
+        self._out_queue: List[bytes] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Last (position, velocity) sent; unchanged samples are not resent
+        self._last_sent_position: Optional[tuple] = None
+        # Latest sample waiting for the next send slot, and the task sending it
+        self._pending_position: Optional[tuple] = None
+        self._position_task: Optional[asyncio.Task] = None
+        self._last_position_send = float("-inf")
+
+        # In-flight requests awaiting a reply, keyed by message_id
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
 
         # Connection state
         self.connected = False
@@ -182,8 +262,14 @@ class NetworkClient:
             True if connection successful
         """
         try:
-            # Create HTTP session
-            self.http_session = aiohttp.ClientSession()
+            # Create HTTP session on the shared pool, so keep-alive connections
+            # outlive this client and are reused by the next one
+            if self.http_session is None or self.http_session.closed:
+                self.http_session = aiohttp.ClientSession(
+                    connector=_get_shared_connector(),
+                    connector_owner=False
+                )
+                self._owns_http_session = True
 
             # Authenticate
             auth_result = await self._authenticate(username, password)
@@ -211,7 +297,16 @@ class NetworkClient:
         """Disconnect from master server."""
         logger.info("Disconnecting from master server")
 
-        # Close WebSocket
+        # Send anything still queued, then close WebSocket
+        if self._position_task:
+            self._position_task.cancel()
+            self._position_task = None
+        self._pending_position = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._flush_outbound(delay=0)
+
         if self.ws_task:
             self.ws_task.cancel()
             self.ws_task = None
@@ -223,24 +318,41 @@ class NetworkClient:
         # Logout
         if self.session_token and self.http_session:
             try:
-                await self.http_session.post(
+                # Release the response so its connection returns to the pool
+                async with self.http_session.post(
                     f"{self.master_server_url}/api/auth/logout",
                     json={"session_token": self.session_token}
-                )
+                ):
+                    pass
             except Exception as e:
                 logger.error(f"Logout error: {e}")
 
-        # Close HTTP session
-        if self.http_session:
+        # Close HTTP session (the shared connector stays open)
+        if self.http_session and self._owns_http_session:
             await self.http_session.close()
             self.http_session = None
 
+        # Fail any requests still waiting on a reply
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Disconnected"))
+        self._pending.clear()
+
         self.connected = False
         self.authenticated = False
         self.session_token = None
 
         logger.info("Disconnected from master server")
 
+    @classmethod
+    async def shutdown_shared(cls):
+        """Close the connection pool shared by all clients; call on app exit."""
+        global _shared_connector, _shared_connector_loop
+        if _shared_connector is not None:
+            await _shared_connector.close()
+            _shared_connector = None
+            _shared_connector_loop = None
+
     async def _authenticate(self, username: str, password: str) -> bool:
         """Authenticate with master server."""
         try:
@@ -269,6 +381,7 @@ class NetworkClient:
             self.ws = await self.http_session.ws_connect(
                 f"{self.master_server_url.replace('http', 'ws')}/ws"
             )
+            self._last_sent_position = None
 
             # Send authentication message
             auth_msg = create_auth_request(
@@ -290,7 +403,7 @@ class NetworkClient:
         """Receive and process WebSocket messages."""
         try:
             async for msg in self.ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
                     await self._handle_message(msg.data)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     logger.error(f"WebSocket error: {self.ws.exception()}")
@@ -341,6 +454,7 @@ class NetworkClient:
 
                 if data.get("success"):
                     self.character_id = character_id
+                    self._last_sent_position = None
                     logger.info(f"Selected character ID: {character_id}")
                     return True
                 else:
@@ -387,6 +501,12 @@ class NetworkClient:
         """
         Send position update (for smooth movement).
 
+        Updates go out at most once per POSITION_SEND_INTERVAL. Samples
+        arriving faster replace the one waiting, so only the latest is sent.
+        Samples within POSITION_DEADBAND of the last sent position, with the
+        same velocity, are skipped; the WebSocket is ordered and reliable, so
+        the server still holds the last position sent.
+
         Args:
             position: Current position (x, y, z)
             velocity: Optional velocity vector
@@ -394,6 +514,23 @@ class NetworkClient:
         if not self.character_id:
             return
 
+        self._pending_position = (position, velocity)
+        if self._position_task is None or self._position_task.done():
+            delay = self._last_position_send + POSITION_SEND_INTERVAL - time.monotonic()
+            self._position_task = asyncio.create_task(self._flush_position(max(delay, 0.0)))
+
+    async def _flush_position(self, delay: float):
+        """Send the latest pending position sample after a delay."""
+        if delay:
+            await asyncio.sleep(delay)
+        pending, self._pending_position = self._pending_position, None
+        if pending is None:
+            return
+        position, velocity = pending
+        if self._position_unchanged(position, velocity):
+            return
+        self._last_position_send = time.monotonic()
+
         try:
             move_msg = MoveMessage(
                 character_id=self.character_id,
@@ -403,10 +540,24 @@ class NetworkClient:
             )
 
             await self._send_ws_message(move_msg)
+            self._last_sent_position = (dict(position), dict(velocity) if velocity else None)
 
         except Exception as e:
             logger.error(f"Send position update error: {e}")
 
+    def _position_unchanged(self, position: Dict[str, float],
+                            velocity: Optional[Dict[str, float]]) -> bool:
+        """Check whether a sample is within the deadband of the last one sent."""
+        if self._last_sent_position is None:
+            return False
+        last_position, last_velocity = self._last_sent_position
+        if (velocity or None) != last_velocity or position.keys() != last_position.keys():
+            return False
+        return all(
+            abs(value - last_position[axis]) < POSITION_DEADBAND
+            for axis, value in position.items()
+        )
+
     # ========================================================================
     # Chat & Communication
     # ========================================================================
@@ -604,25 +755,46 @@ class NetworkClient:
 
         Args:
             message_type: Message type to handle
-            handler: Async callback function
+            handler: Async or plain callback function
         """
-        if message_type not in self.message_handlers:
-            self.message_handlers[message_type] = []
-        self.message_handlers[message_type].append(handler)
+        self.message_handlers.setdefault(message_type, []).append(
+            (handler, asyncio.iscoroutinefunction(handler))
+        )
+        self._wanted_codes[MESSAGE_TYPE_CODES[MessageType(message_type).value]] = 1
 
-    async def _handle_message(self, raw_message: str):
-        """Handle incoming message."""
+    async def _handle_message(self, raw_message: Union[str, bytes, memoryview]):
+        """Handle incoming message (JSON text or binary frame)."""
         try:
-            # Decrypt if encryption enabled
-            if self.encryption_enabled and self.encryption_handler:
-                try:
-                    raw_message = self.encryption_handler.decrypt(raw_message)
-                except Exception:
-                    # Message might not be encrypted
-                    pass
+            if not isinstance(raw_message, str):
+                if len(raw_message) > 1 and raw_message[1] & FRAME_FLAG_BATCH:
+                    for frame in protocol.split_frames(raw_message):
+                        await self._handle_message(frame)
+                    return
+
+                # Skip decoding frames that nothing here handles
+                # (while requests are in flight, their replies must get through)
+                code = raw_message[0] if raw_message else None
+                if (not self._pending and code is not None
+                        and code < len(self._wanted_codes) and not self._wanted_codes[code]):
+                    return
+                message = protocol.decode(raw_message)
+            else:
+                # Decrypt if encryption enabled
+                if self.encryption_enabled and self.encryption_handler:
+                    try:
+                        raw_message = self.encryption_handler.decrypt(raw_message)
+                    except Exception:
+                        # Message might not be encrypted
+                        pass
 
-            # Deserialize
-            message = protocol.deserialize(raw_message)
+                # Deserialize
+                message = protocol.deserialize(raw_message)
+
+            # Resolve a pending request waiting on this reply
+            if message.message_id is not None:
+                future = self._pending.pop(message.message_id, None)
+                if future is not None and not future.done():
+                    future.set_result(message)
 
             # Update nearby players on movement/character updates
             if message.type == MessageType.CHARACTER_UPDATE:
@@ -635,12 +807,25 @@ class NetworkClient:
                     "level": char_msg.level,
                     "faction": char_msg.faction
                 })
+            elif message.type == MessageType.POSITION_BATCH:
+                batch: PositionBatchMessage = message
+                for character_id, location_id, position in zip(
+                    batch.character_ids, batch.location_ids, batch.positions
+                ):
+                    player = self.nearby_players.get(character_id)
+                    if player is None:
+                        continue
+                    if position is not None:
+                        player.update_position(position)
+                    if location_id:
+                        player.location_id = location_id
 
             # Call registered handlers
-            if message.type in self.message_handlers:
-                for handler in self.message_handlers[message.type]:
+            handlers = self.message_handlers.get(message.type)
+            if handlers:
+                for handler, is_coroutine in handlers:
                     try:
-                        if asyncio.iscoroutinefunction(handler):
+                        if is_coroutine:
                             await handler(message)
                         else:
                             handler(message)
@@ -659,26 +844,84 @@ class NetworkClient:
             return
 
         try:
-            serialized = protocol.serialize(message)
-
-            # Encrypt if enabled
+            # Encrypted messages travel as text; otherwise use binary frames
             if self.encryption_enabled and self.encryption_handler:
+                serialized = protocol.serialize(message)
                 serialized = self.encryption_handler.encrypt(serialized)
+                await self.ws.send_str(serialized)
+            else:
+                self._out_queue.append(protocol.encode(message))
+                if self._flush_task is None or self._flush_task.done():
+                    self._flush_task = asyncio.create_task(self._flush_outbound())
+
+        except Exception as e:
+            logger.error(f"Send WebSocket message error: {e}")
 
-            await self.ws.send_str(serialized)
+    async def _flush_outbound(self, delay: float = OUTBOUND_FLUSH_DELAY):
+        """Send queued binary frames as one WebSocket message after a short delay."""
+        if delay:
+            await asyncio.sleep(delay)
+        frames, self._out_queue = self._out_queue, []
+        if not frames or not self.ws or self.ws.closed:
+            return
 
+        try:
+            if len(frames) == 1:
+                await self.ws.send_bytes(frames[0])
+            else:
+                await self.ws.send_bytes(protocol.encode_batch(frames))
         except Exception as e:
             logger.error(f"Send WebSocket message error: {e}")
 
+    async def request(self, message: BaseMessage, timeout: float = 5.0) -> Optional[BaseMessage]:
+        """
+        Send a message and wait for the server's reply to it.
+
+        The reply is matched by message_id and delivered by the receive loop,
+        so no polling is involved.
+
+        Args:
+            message: Message to send (its message_id is overwritten)
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Reply message, or None on timeout or disconnect
+        """
+        if not self.ws or self.ws.closed:
+            logger.error("WebSocket not connected")
+            return None
+
+        message.message_id = f"req-{next(self._request_ids)}"
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message.message_id] = future
+        try:
+            await self._send_ws_message(message)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"No reply to {message.type} within {timeout}s")
+            return None
+        except ConnectionError:
+            return None  # Disconnected while waiting
+        finally:
+            self._pending.pop(message.message_id, None)
+
     # ========================================================================
     # Ping/Heartbeat
     # ========================================================================
 
-    async def ping(self):
-        """Send ping to server."""
+    async def ping(self, timeout: float = 5.0) -> Optional[float]:
+        """
+        Send ping to server and wait for the pong.
+
+        Returns:
+            Round-trip time in seconds, or None if no pong arrived
+        """
         if self.ws and not self.ws.closed:
             ping_msg = BaseMessage(type=MessageType.PING)
-            await self._send_ws_message(ping_msg)
+            started = asyncio.get_running_loop().time()
+            if await self.request(ping_msg, timeout) is not None:
+                return asyncio.get_running_loop().time() - started
+        return None
 
 
 # ============================================================================
@@ -748,6 +991,7 @@ async def example_usage():
     finally:
         # Disconnect
         await client.disconnect()
+        await NetworkClient.shutdown_shared()
 
 
 if __name__ == "__main__":
@@ -756,4 +1000,11 @@ if __name__ == "__main__":
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
+    # Optional: libuv-based event loop (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(example_usage())
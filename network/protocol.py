@@ -6,17 +6,29 @@ and protocol version handling for client-server and P2P communication.
 """
 import json
 import logging
-from datetime import datetime
+import struct
+import time
 from enum import Enum
 from typing import Any, Dict, Optional, List, Union
 from dataclasses import dataclass, asdict, field
-from pydantic import BaseModel, Field, validator, ValidationError
+from pydantic import BaseModel, Field, model_validator, ValidationError
+
+try:
+    import msgpack
+except ImportError:  # Optional: binary frames fall back to a JSON body
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
 # Protocol version - increment when making breaking changes
 PROTOCOL_VERSION = "1.0.0"
 
+# Binary frame header: (msg_type code: u8, flags: u8)
+FRAME_HEADER = struct.Struct("!BB")
+FRAME_FLAG_MSGPACK = 0x01  # Body is msgpack; otherwise UTF-8 JSON
+FRAME_FLAG_BATCH = 0x02  # Body is a sequence of length-prefixed frames
+FRAME_LENGTH = struct.Struct("!I")
+
 
 class MessageType(str, Enum):
     """
@@ -89,6 +101,9 @@ class MessageType(str, Enum):
     ERROR = "error"
     INVALID_MESSAGE = "invalid_message"
 
+    # Movement batching (appended so earlier frame codes keep their values)
+    POSITION_BATCH = "position_batch"
+
 
 class MessagePriority(int, Enum):
     """Message priority for queue ordering."""
@@ -98,6 +113,15 @@ class MessagePriority(int, Enum):
     CRITICAL = 3
 
 
+# One-byte codes for binary frame headers, in definition order. Existing codes
+# must never shift: append new types to the end of MessageType (compatible) and
+# bump PROTOCOL_VERSION if an existing code ever has to change
+MESSAGE_TYPE_CODES: Dict[str, int] = {
+    msg_type.value: code for code, msg_type in enumerate(MessageType)
+}
+_MESSAGE_TYPES_BY_CODE = tuple(MessageType)
+
+
 # ============================================================================
 # Pydantic Models for Message Validation
 # ============================================================================
@@ -105,7 +129,7 @@ class MessagePriority(int, Enum):
 class BaseMessage(BaseModel):
     """Base message structure with common fields."""
     type: MessageType
-    timestamp: float = Field(default_factory=lambda: datetime.utcnow().timestamp())
+    timestamp: float = Field(default_factory=time.time)
     version: str = PROTOCOL_VERSION
     message_id: Optional[str] = None
     priority: MessagePriority = MessagePriority.NORMAL
@@ -118,9 +142,15 @@ class AuthRequest(BaseMessage):
     """Authentication request from client."""
     type: MessageType = MessageType.AUTH_REQUEST
     username: str = Field(..., min_length=3, max_length=50)
-    password: str = Field(..., min_length=6)
+    password: str = ""  # May be empty when resuming with a session token
     session_token: Optional[str] = None
 
+    @model_validator(mode="after")
+    def _check_credentials(self):
+        if not self.session_token and len(self.password) < 6:
+            raise ValueError("password must be at least 6 characters")
+        return self
+
 
 class AuthResponse(BaseMessage):
     """Authentication response from server."""
@@ -129,7 +159,7 @@ class AuthResponse(BaseMessage):
     session_token: Optional[str] = None
     player_id: Optional[int] = None
     message: Optional[str] = None
-    server_time: float = Field(default_factory=lambda: datetime.utcnow().timestamp())
+    server_time: float = Field(default_factory=time.time)
 
 
 class ChatMessage(BaseMessage):
@@ -169,6 +199,19 @@ class MoveMessage(BaseMessage):
     velocity: Optional[Dict[str, float]] = None
 
 
+class PositionBatchMessage(BaseMessage):
+    """
+    Coalesced movement updates for one server tick.
+
+    Parallel lists: entry i is the latest move of character_ids[i].
+    A location id of 0 means the character stayed in its location.
+    """
+    type: MessageType = MessageType.POSITION_BATCH
+    character_ids: List[int]
+    location_ids: List[int]
+    positions: List[Optional[Dict[str, float]]]
+
+
 class PartyInviteMessage(BaseMessage):
     """Party invitation."""
     type: MessageType = MessageType.PARTY_INVITE
@@ -224,7 +267,7 @@ class ShardCapturedMessage(BaseMessage):
     captured_by_character_name: str
     faction: str
     previous_owner_faction: Optional[str] = None
-    timestamp: float = Field(default_factory=lambda: datetime.utcnow().timestamp())
+    timestamp: float = Field(default_factory=time.time)
 
 
 class WorldStateMessage(BaseMessage):
@@ -260,6 +303,7 @@ MESSAGE_MODELS = {
     MessageType.WHISPER: ChatMessage,
     MessageType.CHARACTER_UPDATE: CharacterUpdateMessage,
     MessageType.MOVE: MoveMessage,
+    MessageType.POSITION_BATCH: PositionBatchMessage,
     MessageType.PARTY_INVITE: PartyInviteMessage,
     MessageType.PARTY_UPDATE: PartyUpdateMessage,
     MessageType.COMBAT_ACTION: CombatActionMessage,
@@ -294,6 +338,17 @@ class ProtocolHandler:
         self.supported_versions = supported_versions or [PROTOCOL_VERSION]
         self.logger = logging.getLogger(__name__)
 
+        # One reusable packer (and its internal buffer) for every binary frame;
+        # like the rest of the handler it is meant for a single event loop thread
+        self._packer = (
+            msgpack.Packer(use_bin_type=True, default=str) if msgpack is not None else None
+        )
+        # Prebuilt frame headers, indexed by message type code
+        flags = FRAME_FLAG_MSGPACK if msgpack is not None else 0
+        self._frame_headers = tuple(
+            FRAME_HEADER.pack(code, flags) for code in range(len(_MESSAGE_TYPES_BY_CODE))
+        )
+
     def serialize(self, message: BaseMessage) -> str:
         """
         Serialize a message object to JSON string.
@@ -309,7 +364,7 @@ class ProtocolHandler:
         """
         try:
             # Convert Pydantic model to dict, then to JSON
-            message_dict = message.dict()
+            message_dict = message.model_dump()
             json_str = json.dumps(message_dict, default=str)
             return json_str
         except Exception as e:
@@ -332,7 +387,161 @@ class ProtocolHandler:
         try:
             # Parse JSON
             data = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON decode error: {e}")
+            raise ProtocolError(f"Invalid JSON: {e}")
+        except Exception as e:
+            self.logger.error(f"Deserialization error: {e}")
+            raise ProtocolError(f"Failed to deserialize message: {e}")
+
+        return self._build_message(data)
+
+    def encode(self, message: BaseMessage) -> bytes:
+        """
+        Encode a message object to a binary WebSocket frame.
+
+        The frame starts with a 2-byte header (message type code, flags) so
+        receivers can route on type before decoding the body. The body is
+        msgpack when available, otherwise UTF-8 JSON.
+
+        Args:
+            message: Message object (must inherit from BaseMessage)
+
+        Returns:
+            Binary frame
+
+        Raises:
+            ProtocolError: If encoding fails
+        """
+        try:
+            message_dict = message.model_dump()
+            header = self._frame_headers[MESSAGE_TYPE_CODES[message_dict["type"]]]
+            if self._packer is not None:
+                body = self._packer.pack(message_dict)
+            else:
+                body = json.dumps(message_dict, default=str).encode()
+            return header + body
+        except Exception as e:
+            self.logger.error(f"Encoding error: {e}")
+            raise ProtocolError(f"Failed to encode message: {e}")
+
+    def peek_type(self, frame: bytes) -> MessageType:
+        """
+        Read the message type from a binary frame header without decoding it.
+
+        Args:
+            frame: Binary frame produced by encode()
+
+        Returns:
+            Message type
+
+        Raises:
+            ProtocolError: If the header is missing or unknown
+        """
+        if len(frame) < FRAME_HEADER.size:
+            raise ProtocolError("Frame shorter than header")
+        code = frame[0]
+        if code >= len(_MESSAGE_TYPES_BY_CODE):
+            raise ProtocolError(f"Unknown message type code: {code}")
+        return _MESSAGE_TYPES_BY_CODE[code]
+
+    def decode(self, frame: bytes) -> BaseMessage:
+        """
+        Decode a binary frame to message object.
+
+        Args:
+            frame: Binary frame produced by encode()
+
+        Returns:
+            Validated message object
+
+        Raises:
+            ProtocolError: If decoding or validation fails
+        """
+        msg_type = self.peek_type(frame)
+        flags = frame[1]
+        if flags & FRAME_FLAG_BATCH:
+            raise ProtocolError("Batch frames must be split before decoding")
+        try:
+            body = memoryview(frame)[FRAME_HEADER.size:]
+            if flags & FRAME_FLAG_MSGPACK:
+                if msgpack is None:
+                    raise ProtocolError("msgpack frame received but msgpack is not installed")
+                data = msgpack.unpackb(body, raw=False)
+            else:
+                data = json.loads(bytes(body))
+        except ProtocolError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Frame decode error: {e}")
+            raise ProtocolError(f"Invalid frame body: {e}")
+
+        if not isinstance(data, dict) or data.get("type") != msg_type.value:
+            raise ProtocolError("Frame header does not match message type")
+
+        return self._build_message(data)
+
+    def encode_batch(self, frames: List[bytes]) -> bytes:
+        """
+        Pack several binary frames into one batch frame.
+
+        Args:
+            frames: Frames produced by encode()
+
+        Returns:
+            Batch frame (header with FRAME_FLAG_BATCH, then u32-length-prefixed frames)
+        """
+        parts = [FRAME_HEADER.pack(0, FRAME_FLAG_BATCH)]
+        for frame in frames:
+            parts.append(FRAME_LENGTH.pack(len(frame)))
+            parts.append(frame)
+        return b"".join(parts)
 
+    def split_frames(self, frame: bytes) -> List[memoryview]:
+        """
+        Split a batch frame into its frames; other frames are returned as-is.
+
+        Args:
+            frame: Binary frame or batch frame
+
+        Returns:
+            Zero-copy views of the contained frames
+
+        Raises:
+            ProtocolError: If the batch is truncated
+        """
+        view = memoryview(frame)
+        if len(view) < FRAME_HEADER.size or not view[1] & FRAME_FLAG_BATCH:
+            return [view]
+
+        frames = []
+        offset = FRAME_HEADER.size
+        while offset < len(view):
+            if offset + FRAME_LENGTH.size > len(view):
+                raise ProtocolError("Truncated batch frame")
+            (length,) = FRAME_LENGTH.unpack_from(view, offset)
+            offset += FRAME_LENGTH.size
+            end = offset + length
+            if end > len(view):
+                raise ProtocolError("Truncated batch frame")
+            frames.append(view[offset:end])
+            offset = end
+        return frames
+
+    def _build_message(self, data: Dict[str, Any]) -> BaseMessage:
+        """
+        Validate a decoded message dict and build its message object.
+
+        Args:
+            data: Decoded message fields
+
+        Returns:
+            Validated message object
+
+        Raises:
+            ProtocolError: If validation fails
+        """
+        try:
             # Validate protocol version
             version = data.get("version", "unknown")
             if version not in self.supported_versions:
@@ -359,9 +568,8 @@ class ProtocolHandler:
 
             return message
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"JSON decode error: {e}")
-            raise ProtocolError(f"Invalid JSON: {e}")
+        except ProtocolError:
+            raise
         except ValidationError as e:
             self.logger.error(f"Validation error: {e}")
             raise ProtocolError(f"Message validation failed: {e}")
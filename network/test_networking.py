@@ -5,8 +5,9 @@ Tests protocol serialization, message validation, and basic client-server commun
 """
 import pytest
 import asyncio
+import aiohttp
 import json
-from datetime import datetime
+import time
 
 from network.protocol import (
     protocol,
@@ -14,6 +15,8 @@ from network.protocol import (
     ProtocolError,
     MessageType,
     MessagePriority,
+    MESSAGE_TYPE_CODES,
+    PROTOCOL_VERSION,
     create_auth_request,
     create_auth_response,
     create_chat_message,
@@ -23,8 +26,12 @@ from network.protocol import (
     create_world_state_message,
 )
 
-from network.master_server import SessionManager, PlayerSession
-from network.peer import EncryptionHandler
+from network.master_server import (
+    MasterServer, SessionManager, PlayerSession, TokenPool, MoveAggregator,
+    location_channel, player_id_for,
+)
+from network import peer
+from network.peer import EncryptionHandler, NetworkClient
 
 
 # ============================================================================
@@ -156,6 +163,32 @@ class TestProtocol:
         assert data["reality_stability"] == 95.5
         assert data["active_players"] == 10
 
+    def test_batch_frame_split(self):
+        """Test that batched frames split back into their messages."""
+        frames = [
+            protocol.encode(create_chat_message(1, "Test", "one")),
+            protocol.encode(create_move_message(1, 2)),
+        ]
+        batch = protocol.encode_batch(frames)
+
+        split = protocol.split_frames(batch)
+        assert [bytes(frame) for frame in split] == frames
+        assert protocol.decode(split[0]).content == "one"
+        assert protocol.split_frames(frames[0]) == [frames[0]]
+
+        with pytest.raises(ProtocolError):
+            protocol.split_frames(batch[:-1])
+        with pytest.raises(ProtocolError):
+            protocol.decode(batch)
+
+    def test_auth_request_with_session_token(self):
+        """Test that a session token stands in for the password."""
+        msg = create_auth_request("testuser", "", session_token="token")
+        assert msg.session_token == "token"
+
+        with pytest.raises(ValueError):
+            create_auth_request("testuser", "")
+
     def test_invalid_json(self):
         """Test that invalid JSON raises ProtocolError."""
         with pytest.raises(ProtocolError):
@@ -169,7 +202,39 @@ class TestProtocol:
     def test_unknown_message_type(self):
         """Test that unknown message type raises ProtocolError."""
         with pytest.raises(ProtocolError):
-            protocol.deserialize('{"type": "unknown_type", "version": "1.0.0"}')
+            protocol.deserialize(json.dumps({"type": "unknown_type", "version": PROTOCOL_VERSION}))
+
+    def test_binary_frame_roundtrip(self):
+        """Test binary frame encoding and decoding."""
+        msg = create_move_message(1, 7, from_location_id=3, position={"x": 1.5, "y": 0.0, "z": -2.0})
+        frame = protocol.encode(msg)
+
+        assert isinstance(frame, bytes)
+        assert protocol.peek_type(frame) == MessageType.MOVE
+
+        decoded = protocol.decode(frame)
+        assert decoded.type == MessageType.MOVE
+        assert decoded.to_location_id == 7
+        assert decoded.position == {"x": 1.5, "y": 0.0, "z": -2.0}
+
+    def test_message_type_codes_are_stable(self):
+        """Test that frame codes of existing types never shift."""
+        assert MESSAGE_TYPE_CODES["auth_request"] == 0
+        assert MESSAGE_TYPE_CODES["move"] == 10
+        assert MESSAGE_TYPE_CODES["location_update"] == 11
+        assert MESSAGE_TYPE_CODES["invalid_message"] == 46
+        assert MESSAGE_TYPE_CODES["position_batch"] == 47
+
+    def test_existing_clients_stay_supported(self):
+        """Test that 1.0.0 messages are still accepted after appending types."""
+        assert protocol.deserialize('{"type": "ping", "version": "1.0.0"}').type == MessageType.PING
+
+    def test_invalid_binary_frame(self):
+        """Test that truncated or unknown frames raise ProtocolError."""
+        with pytest.raises(ProtocolError):
+            protocol.decode(b"\x00")
+        with pytest.raises(ProtocolError):
+            protocol.decode(bytes([255, 0]) + b"{}")
 
     def test_message_priority(self):
         """Test message priority assignment."""
@@ -241,7 +306,7 @@ class TestSessionManager:
         session = manager.create_session(1, "testuser")
 
         # Manually expire the session
-        session.last_activity = datetime(2000, 1, 1)
+        session.last_activity -= 7200
 
         retrieved = manager.get_session(session.session_token)
         assert retrieved is None
@@ -255,7 +320,7 @@ class TestSessionManager:
         s2 = manager.create_session(2, "user2")
 
         # Expire one
-        s1.last_activity = datetime(2000, 1, 1)
+        s1.last_activity -= 7200
 
         # Cleanup
         manager.cleanup_expired_sessions()
@@ -264,6 +329,23 @@ class TestSessionManager:
         assert manager.get_session(s1.session_token) is None
         assert manager.get_session(s2.session_token) is not None
 
+    def test_cleanup_pops_due_deadlines(self, monkeypatch):
+        """Test that cleanup expires idle sessions and keeps refreshed ones."""
+        manager = SessionManager()
+        idle = manager.create_session(1, "idle")
+        active = manager.create_session(2, "active")
+
+        real_monotonic = time.monotonic
+        monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + 3000)
+        active.update_activity()
+        monkeypatch.setattr(time, "monotonic", lambda: real_monotonic() + 4000)
+
+        manager.cleanup_expired_sessions()
+
+        assert idle.session_token not in manager.sessions
+        assert active.session_token in manager.sessions
+        assert manager.next_expiry() == pytest.approx(real_monotonic() + 3000 + 3600, abs=1)
+
     def test_active_player_count(self):
         """Test getting active player count."""
         manager = SessionManager()
@@ -284,6 +366,20 @@ class TestSessionManager:
 
         assert s1.session_token != s2.session_token
 
+    def test_token_pool_refills(self):
+        """Test that pooled tokens stay unique across batch refills."""
+        pool = TokenPool(batch_size=4)
+        tokens = [pool.get() for _ in range(10)]
+
+        assert len(set(tokens)) == 10
+        assert all(len(token) == 43 for token in tokens)
+
+    def test_player_id_is_stable(self):
+        """Test that player IDs are deterministic and fit in a JSON-safe int."""
+        assert player_id_for("alice") == player_id_for("alice")
+        assert player_id_for("alice") != player_id_for("bob")
+        assert 0 <= player_id_for("alice") < 2 ** 53
+
     def test_replace_existing_session(self):
         """Test that creating a new session invalidates old one."""
         manager = SessionManager()
@@ -297,6 +393,103 @@ class TestSessionManager:
         assert old_token != new_token
         assert manager.get_session(old_token) is None
         assert manager.get_session(new_token) is not None
+        assert manager.get_session_by_player_id(1) is s2
+        assert len(manager.sessions) == len(manager.player_sessions) == 1
+
+
+# ============================================================================
+# Movement Coalescing Tests
+# ============================================================================
+
+class TestMoveAggregator:
+    """Test per-tick movement coalescing."""
+
+    def test_flush_keeps_latest_move_per_character(self):
+        """Test that repeated moves collapse into one batch entry."""
+        aggregator = MoveAggregator()
+        aggregator.add(create_move_message(1, 5, position={"x": 0.0, "y": 0.0, "z": 0.0}))
+        aggregator.add(create_move_message(2, 6))
+        aggregator.add(create_move_message(1, 5, position={"x": 2.0, "y": 1.0, "z": 0.0}))
+
+        batch = aggregator.flush()["global"]
+
+        assert batch.type == MessageType.POSITION_BATCH
+        assert batch.character_ids == [1, 2]
+        assert batch.location_ids == [5, 6]
+        assert batch.positions == [{"x": 2.0, "y": 1.0, "z": 0.0}, None]
+        assert aggregator.flush() == {}
+
+    def test_flush_groups_by_location_channel(self):
+        """Test that moves are only batched for their location's channel."""
+        manager = SessionManager()
+        session = manager.create_session(1, "user1")
+        manager.set_session_location(session, 5)
+        manager.set_session_location(session, 6)
+        assert session.channels == {location_channel(6)}
+
+        aggregator = MoveAggregator()
+        aggregator.add(create_move_message(1, 6), location_channel(6))
+        aggregator.add(create_move_message(2, 7), location_channel(7))
+        batches = aggregator.flush()
+
+        assert batches[location_channel(6)].character_ids == [1]
+        assert batches[location_channel(7)].character_ids == [2]
+
+    def test_move_is_attributed_to_session_character(self):
+        """Test that a spoofed character id cannot move another player."""
+        server = MasterServer()
+        session = server.session_manager.create_session(1, "user1")
+
+        server._queue_move(create_move_message(2, 5), session)
+        assert server.move_aggregator.flush() == {}
+
+        session.character_id = 7
+        server._queue_move(create_move_message(2, 5, position={"x": 1.0, "y": 0.0, "z": 0.0}), session)
+        batch = server.move_aggregator.flush()[location_channel(5)]
+
+        assert batch.character_ids == [7]
+        assert batch.positions == [{"x": 1.0, "y": 0.0, "z": 0.0}]
+
+    def test_location_change_reaches_old_location(self):
+        """Test that players in the old location see the mover leave."""
+        server = MasterServer()
+        session = server.session_manager.create_session(1, "user1", character_id=7)
+        server._queue_move(create_move_message(7, 5), session)
+        server.move_aggregator.flush()
+
+        server._queue_move(create_move_message(7, 6), session)
+        batches = server.move_aggregator.flush()
+
+        assert set(batches) == {location_channel(5), location_channel(6)}
+        assert batches[location_channel(5)].location_ids == [6]
+
+        server._queue_move(create_move_message(7, 6), session)
+        assert set(server.move_aggregator.flush()) == {location_channel(6)}
+
+    def test_location_change_survives_later_position_update(self):
+        """Test that a position update in the same tick keeps the new location."""
+        server = MasterServer()
+        session = server.session_manager.create_session(1, "user1", character_id=7)
+        server._queue_move(create_move_message(7, 3), session)
+        server.move_aggregator.flush()
+
+        server._queue_move(create_move_message(7, 5), session)
+        server._queue_move(create_move_message(7, 0, position={"x": 1.0, "y": 0.0, "z": 0.0}), session)
+        batches = server.move_aggregator.flush()
+
+        assert set(batches) == {location_channel(3), location_channel(5)}
+        for batch in batches.values():
+            assert batch.location_ids == [5]
+            assert batch.positions == [{"x": 1.0, "y": 0.0, "z": 0.0}]
+
+    def test_batch_roundtrip(self):
+        """Test that position batches survive both wire formats."""
+        aggregator = MoveAggregator()
+        aggregator.add(create_move_message(3, 9, position={"x": 1.0, "y": 2.0, "z": 3.0}))
+        batch = aggregator.flush()["global"]
+
+        assert protocol.deserialize(protocol.serialize(batch)).character_ids == [3]
+        assert protocol.decode(protocol.encode(batch)).positions == [{"x": 1.0, "y": 2.0, "z": 3.0}]
 
 
 # ============================================================================
@@ -384,6 +577,102 @@ class TestAsyncIntegration:
 
         assert deserialized.content == "Hello"
 
+    async def test_channel_broadcast(self):
+        """Test that broadcasts reach only the channel's subscribers."""
+        class FakeWebSocket:
+            closed = False
+
+            def __init__(self):
+                self.sent = []
+
+            async def send_str(self, data):
+                self.sent.append(data)
+
+            async def send_bytes(self, data):
+                self.sent.append(data)
+
+            async def send_frame(self, data, opcode):
+                self.sent.append(data.decode("utf-8") if opcode == aiohttp.WSMsgType.TEXT else data)
+
+        manager = SessionManager()
+        text_ws, binary_ws, other_ws = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        manager.subscribe(text_ws, ["global", "faction:Shadowborn"])
+        manager.subscribe(binary_ws, ["global", "faction:Shadowborn"])
+        manager.subscribe(other_ws, ["global"])
+        manager.binary_websockets.add(binary_ws)
+
+        msg = create_chat_message(1, "Test", "Hello", channel="faction")
+        sent = await manager.broadcast("faction:Shadowborn", msg)
+
+        assert sent == 2
+        assert protocol.deserialize(text_ws.sent[0]).content == "Hello"
+        assert protocol.decode(binary_ws.sent[0]).content == "Hello"
+        assert other_ws.sent == []
+
+        manager.unsubscribe(text_ws)
+        assert text_ws not in manager.websockets
+        assert manager.channel_subs["faction:Shadowborn"] == {binary_ws}
+
+    async def test_position_deadband(self, monkeypatch):
+        """Test that unchanged position samples are not resent."""
+        monkeypatch.setattr(peer, "POSITION_SEND_INTERVAL", 0)
+        client = NetworkClient()
+        client.character_id = 1
+        sent = []
+
+        async def record(message):
+            sent.append(message)
+
+        client._send_ws_message = record
+
+        for position, velocity in [
+            ({"x": 1.0, "y": 2.0, "z": 0.0}, None),
+            ({"x": 1.001, "y": 2.0, "z": 0.0}, None),
+            ({"x": 1.5, "y": 2.0, "z": 0.0}, None),
+            ({"x": 1.5, "y": 2.0, "z": 0.0}, {"x": 1.0, "y": 0.0, "z": 0.0}),
+        ]:
+            await client.send_position_update(position, velocity)
+            await client._position_task
+
+        assert [msg.position["x"] for msg in sent] == [1.0, 1.5, 1.5]
+
+    async def test_position_updates_coalesce(self):
+        """Test that samples faster than the send interval collapse to the latest."""
+        client = NetworkClient()
+        client.character_id = 1
+        sent = []
+
+        async def record(message):
+            sent.append(message)
+
+        client._send_ws_message = record
+
+        await client.send_position_update({"x": 1.0, "y": 0.0, "z": 0.0})
+        await client._position_task
+        await client.send_position_update({"x": 2.0, "y": 0.0, "z": 0.0})
+        await client.send_position_update({"x": 3.0, "y": 0.0, "z": 0.0})
+        await client._position_task
+
+        assert [msg.position["x"] for msg in sent] == [1.0, 3.0]
+
+    async def test_world_cache(self):
+        """Test that cached responses are reused until invalidated."""
+        server = MasterServer()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"builds": len(builds)}
+
+        first = await server._cached_json_response("test", build)
+        second = await server._cached_json_response("test", build)
+        assert first.body == second.body
+        assert len(builds) == 1
+
+        server.invalidate_world_cache()
+        third = await server._cached_json_response("test", build)
+        assert json.loads(third.body) == {"builds": 2}
+
 
 # ============================================================================
 # Run Tests
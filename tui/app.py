@@ -0,0 +1,356 @@
+"""
+Top-level Textual application for Shards of Eternity.
+Provides the character selection screen and the game App launched by main.py
+in offline and client modes.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Static, Button, ListView, ListItem
+from textual.containers import Container, Horizontal, ScrollableContainer
+from textual.binding import Binding
+
+from database import get_db_session
+from database.models import Character, RaceType, ClassType, FactionType
+from characters.character import CharacterCreator
+from config.settings import get_settings
+from tui.main_screen import MainGameScreen
+from tui.character_screen import CharacterCreationScreen
+
+if TYPE_CHECKING:
+    from network.master_server import MasterServer
+
+logger = logging.getLogger(__name__)
+
+# Only the columns the character picker renders
+_LIST_COLUMNS = (
+    Character.id,
+    Character.name,
+    Character.level,
+    Character.race,
+    Character.character_class,
+    Character.faction,
+)
+
+# Enum member -> display text, so labels skip the Enum.value descriptor per row
+_RACE_LABEL = {member: member.value for member in RaceType}
+_CLASS_LABEL = {member: member.value for member in ClassType}
+_FACTION_LABEL = {member: member.value for member in FactionType}
+
+
+# ============================================================================
+# CHARACTER SELECTION SCREEN
+# ============================================================================
+
+class CharacterSelectionScreen(Screen):
+    """Screen for selecting or creating a character."""
+
+    BINDINGS = [
+        Binding("escape", "quit", "Quit"),
+        Binding("n", "new_character", "New Character"),
+    ]
+
+    DEFAULT_CSS = """
+    CharacterSelectionScreen {
+        layout: vertical;
+        align: center middle;
+    }
+
+    #selection-container {
+        width: 80;
+        height: 30;
+        border: solid $primary;
+        padding: 2;
+    }
+
+    #title {
+        text-align: center;
+        text-style: bold;
+        background: $primary;
+        color: $text;
+        padding: 1;
+        margin-bottom: 2;
+    }
+
+    #character-list {
+        height: 1fr;
+        margin-bottom: 2;
+    }
+
+    #button-container {
+        height: 5;
+        align: center middle;
+    }
+
+    .char-button {
+        margin: 0 1;
+        min-width: 20;
+    }
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # IDs of listed characters (ORM rows are detached once their session closes)
+        self.character_ids: List[int] = []
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+
+        with Container(id="selection-container"):
+            yield Static("SHARDS OF ETERNITY", id="title")
+            yield Static("Select a character or create a new one:", id="subtitle")
+
+            with ScrollableContainer(id="character-list"):
+                yield ListView(id="char-list")
+
+            with Horizontal(id="button-container"):
+                yield Button("New Character", id="btn-new", variant="primary", classes="char-button")
+                yield Button("Delete", id="btn-delete", variant="error", classes="char-button")
+                yield Button("Quit", id="btn-quit", classes="char-button")
+
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Load characters when screen mounts."""
+        self.load_characters()
+
+    def load_characters(self) -> None:
+        """Load all player characters from database and rebuild the list."""
+        try:
+            with get_db_session() as session:
+                characters = (
+                    session.query(*_LIST_COLUMNS)
+                    .filter_by(is_player=True)
+                    .all()
+                )
+                self.character_ids = [char.id for char in characters]
+
+                char_list = self.query_one("#char-list", ListView)
+                char_list.clear()
+
+                if characters:
+                    for char in characters:
+                        char_list.append(self._character_item(char))
+                else:
+                    char_list.append(self._empty_item())
+
+        except Exception as e:
+            logger.error(f"Error loading characters: {e}")
+            self.app.notify(f"Error loading characters: {e}", severity="error")
+
+    @staticmethod
+    def _character_item(char) -> ListItem:
+        """Build the list entry for one character row (see _LIST_COLUMNS)."""
+        # Styled spans are appended directly, so Rich never parses markup here
+        char_text = Text()
+        char_text.append(char.name, style="bold cyan")
+        char_text.append(
+            f" - Lvl {char.level} {_RACE_LABEL[char.race]} {_CLASS_LABEL[char.character_class]} | "
+        )
+        char_text.append(_FACTION_LABEL[char.faction], style="yellow")
+        return ListItem(Static(char_text), name=str(char.id))
+
+    @staticmethod
+    def _empty_item() -> ListItem:
+        """Build the placeholder entry shown when there are no characters."""
+        return ListItem(Static("[dim]No characters found. Create your first character![/]"))
+
+    def _append_character(self, char) -> None:
+        """Add a single character to the list without reloading the rest."""
+        char_list = self.query_one("#char-list", ListView)
+        if not self.character_ids:
+            char_list.clear()  # Drop the placeholder
+        self.character_ids.append(char.id)
+        char_list.append(self._character_item(char))
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Handle character selection."""
+        if event.item.name and event.item.name.isdigit():
+            character_id = int(event.item.name)
+            try:
+                with get_db_session() as session:
+                    character = session.get(Character, character_id)
+                    if character:
+                        char_data = character.to_dict()
+                        self.app.selected_character = char_data
+                        self.app.mark_dirty()
+                        self.app.push_screen(MainGameScreen(char_data))
+            except Exception as e:
+                logger.error(f"Error selecting character: {e}")
+                self.app.notify(f"Error selecting character: {e}", severity="error")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle button presses."""
+        if event.button.id == "btn-new":
+            self.action_new_character()
+        elif event.button.id == "btn-delete":
+            self.delete_selected_character()
+        elif event.button.id == "btn-quit":
+            self.app.exit()
+
+    def action_new_character(self) -> None:
+        """Open character creation screen."""
+        def on_character_created(char_data):
+            # Create character in database
+            try:
+                creator = CharacterCreator()
+                # Create base stats
+                base_stats = {
+                    "strength": char_data["stats"]["strength"],
+                    "dexterity": char_data["stats"]["dexterity"],
+                    "constitution": char_data["stats"]["constitution"],
+                    "intelligence": char_data["stats"]["intelligence"],
+                    "wisdom": char_data["stats"]["wisdom"],
+                    "charisma": char_data["stats"]["charisma"]
+                }
+
+                character = creator.create_character(
+                    name=char_data["name"],
+                    race=RaceType[char_data["race"].upper()],
+                    character_class=ClassType[char_data["class"].upper()],
+                    faction=FactionType[char_data["faction"].upper().replace(" ", "_")],
+                    stats=base_stats,
+                    description=char_data.get("description", "")
+                )
+
+                # The returned instance is detached, so read the new row back once
+                with get_db_session() as session:
+                    character = (
+                        session.query(*_LIST_COLUMNS)
+                        .filter_by(name=char_data["name"], is_player=True)
+                        .order_by(Character.id.desc())
+                        .first()
+                    )
+                    if character:
+                        self._append_character(character)
+
+                self.app.notify(f"Character '{char_data['name']}' created successfully!", severity="success")
+            except Exception as e:
+                logger.error(f"Error creating character: {e}")
+                self.app.notify(f"Error creating character: {e}", severity="error")
+
+        self.app.push_screen(CharacterCreationScreen(on_complete=on_character_created))
+
+    def delete_selected_character(self) -> None:
+        """Delete the selected character."""
+        char_list = self.query_one("#char-list", ListView)
+        if char_list.index is not None and char_list.index >= 0:
+            selected_item = char_list.children[char_list.index]
+            if hasattr(selected_item, 'name') and selected_item.name and selected_item.name.isdigit():
+                character_id = int(selected_item.name)
+                try:
+                    with get_db_session() as session:
+                        character = session.get(Character, character_id)
+                        if character:
+                            char_name = character.name
+                            session.delete(character)
+                            session.commit()
+                            self.app.notify(f"Character '{char_name}' deleted", severity="warning")
+
+                    # Drop just this entry instead of reloading the whole list
+                    selected_item.remove()
+                    if character_id in self.character_ids:
+                        self.character_ids.remove(character_id)
+                    if not self.character_ids:
+                        char_list.append(self._empty_item())
+                except Exception as e:
+                    logger.error(f"Error deleting character: {e}")
+                    self.app.notify(f"Error deleting character: {e}", severity="error")
+
+    def action_quit(self) -> None:
+        """Quit the application."""
+        self.app.exit()
+
+
+# ============================================================================
+# MAIN APPLICATION
+# ============================================================================
+
+class ShardsOfEternityApp(App):
+    """Main game application."""
+
+    TITLE = "Shards of Eternity"
+    CSS_PATH = None
+
+    BINDINGS = [
+        Binding("ctrl+q", "quit", "Quit Game"),
+        Binding("ctrl+s", "save", "Save Game"),
+    ]
+
+    def __init__(self, mode: str = "offline", **kwargs):
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.selected_character: Optional[Dict[str, Any]] = None
+        self.autosave_interval = get_settings().autosave_interval
+        self.last_save_time = time.time()
+        # Set by gameplay code via mark_dirty(); autosave skips while clean
+        self._dirty = False
+        self.master_server: Optional["MasterServer"] = None
+        self.shutdown_event = asyncio.Event()
+
+    def on_mount(self) -> None:
+        """Initialize the app when mounted."""
+        logger.info(f"Starting Shards of Eternity in {self.mode} mode")
+
+        # Start with character selection
+        self.push_screen(CharacterSelectionScreen())
+
+        # Setup autosave
+        if self.mode == "offline":
+            self.set_interval(self.autosave_interval, self.autosave)
+
+    def action_save(self) -> None:
+        """Manual save action."""
+        self.save_game()
+        self.notify("Game saved!", severity="information")
+
+    def autosave(self) -> None:
+        """Automatic save handler."""
+        current_time = time.time()
+        if current_time - self.last_save_time >= self.autosave_interval:
+            self.last_save_time = current_time
+            if self._dirty:
+                self.save_game()
+                logger.info("Autosave completed")
+
+    def mark_dirty(self) -> None:
+        """Flag unsaved gameplay changes so the next save writes them."""
+        self._dirty = True
+
+    def save_game(self) -> None:
+        """Save current game state and clear the dirty flag."""
+        if not self.selected_character:
+            return
+
+        try:
+            with get_db_session() as session:
+                char_id = self.selected_character.get('id')
+                if char_id:
+                    character = session.get(Character, char_id)
+                    if character:
+                        # Update character data
+                        # Note: This would be expanded to save current state
+                        character.updated_at = datetime.utcnow()
+                        session.commit()
+                        self._dirty = False
+                        logger.debug(f"Saved character: {character.name}")
+        except Exception as e:
+            logger.error(f"Error saving game: {e}")
+
+    def action_quit(self) -> None:
+        """Handle graceful shutdown."""
+        logger.info("Initiating graceful shutdown...")
+
+        # Save game before quitting
+        if self.selected_character:
+            self.save_game()
+            logger.info("Final save completed")
+
+        # Cleanup and exit
+        self.exit()
@@ -424,10 +424,19 @@ class MainGameScreen(Screen):
         dialogue.add_message("The world awaits your adventure. Use the menu to navigate.", "info")
         dialogue.add_message("Type 'help' for available commands.", "info")
 
+    def _mark_dirty(self) -> None:
+        """Tell the host app that gameplay state changed, if it tracks that."""
+        mark_dirty = getattr(self.app, "mark_dirty", None)
+        if mark_dirty is not None:
+            mark_dirty()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         dialogue = self.query_one(DialoguePanel)
 
+        if event.button.id in ("btn-explore", "btn-rest", "btn-search"):
+            self._mark_dirty()
+
         if event.button.id == "btn-explore":
             dialogue.add_message("You explore your surroundings...", "info")
             action_panel = self.query_one(ActionPanel)
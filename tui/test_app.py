@@ -0,0 +1,66 @@
+"""
+Unit tests for the Shards of Eternity game App.
+
+Tests save handling against a throwaway SQLite database.
+"""
+from datetime import datetime
+
+import pytest
+
+import database
+from database import get_db_session, init_database
+from database.models import Character, RaceType, ClassType, FactionType
+from tui.app import ShardsOfEternityApp
+
+
+@pytest.fixture
+def character_id(tmp_path, monkeypatch):
+    """Point the global engine at a temporary database holding one character."""
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_SessionFactory", None)
+    init_database(f"sqlite:///{tmp_path / 'app.db'}")
+
+    with get_db_session() as session:
+        character = Character(
+            name="Saver",
+            race=RaceType.HUMAN,
+            character_class=ClassType.WARRIOR,
+            faction=FactionType.CRIMSON_COVENANT,
+            updated_at=datetime(2000, 1, 1),
+        )
+        session.add(character)
+        session.flush()
+        return character.id
+
+
+def _updated_at(character_id):
+    with get_db_session() as session:
+        return session.get(Character, character_id).updated_at
+
+
+class TestSaveGame:
+    """Test manual saves and the autosave dirty flag."""
+
+    def test_manual_save_reaches_database(self, character_id):
+        """Test that an explicit save writes even without mark_dirty()."""
+        app = ShardsOfEternityApp()
+        app.selected_character = {"id": character_id}
+
+        app.save_game()
+
+        assert _updated_at(character_id) > datetime(2000, 1, 1)
+
+    def test_autosave_skips_clean_state(self, character_id):
+        """Test that autosave only writes after gameplay marks the game dirty."""
+        app = ShardsOfEternityApp()
+        app.selected_character = {"id": character_id}
+
+        app.last_save_time = 0
+        app.autosave()
+        assert _updated_at(character_id) == datetime(2000, 1, 1)
+
+        app.mark_dirty()
+        app.last_save_time = 0
+        app.autosave()
+        assert _updated_at(character_id) > datetime(2000, 1, 1)
+        assert not app._dirty